@@ -21,17 +21,14 @@ def export_zms_mesh_object(obj, filepath, version=8, export_normals=True,
         obj: the Blender mesh object to export
         filepath: destination .ZMS path
         version: ZMS version (5-8)
-        report: optional callable(level, message) for progress messages
+        report: optional callable({level}, message) for progress messages,
+            e.g. Operator.report
 
     Returns:
         None on success, or an error string on failure.
     """
     if report is None:
         report = lambda level, msg: None
-    # report callbacks take a string level ('INFO'/'ERROR'); wrap into the
-    # set form bpy operator reports expect.
-    raw_report = report
-    report = lambda level, msg: raw_report({level}, msg)
 
     filepath = Path(filepath)
 
@@ -141,7 +138,7 @@ def export_zms_mesh_object(obj, filepath, version=8, export_normals=True,
     except Exception as e:
         return f"Failed to write ZMS file: {str(e)}"
 
-    report('INFO', f"Exported {filepath.name} (v{zms.version}, {len(zms.vertices)} verts, {len(zms.indices)} tris)")
+    report({'INFO'}, f"Exported {filepath.name} (v{zms.version}, {len(zms.vertices)} verts, {len(zms.indices)} tris)")
     return None
 
 
@@ -202,10 +199,8 @@ class ExportZMS(bpy.types.Operator, ExportHelper):
                            export_normals=None, export_colors=None, export_uv=None,
                            report=None):
         """Extract ZMS data from mesh data"""
-        # Create a report function wrapper
         if report is None:
-            report = lambda level, message: (self.report({level}, message)
-                                             if hasattr(self, 'report') else None)
+            report = getattr(self, 'report', None) or (lambda level, message: None)
         if export_normals is None:
             export_normals = getattr(self, 'export_normals', True)
         if export_colors is None:
@@ -50,6 +50,7 @@ from .rose.til import Til
 from .rose.ifo import Ifo
 from .rose.zsc import Zsc
 from .rose.utils import Vector2, Vector3, list_2d, convert_rose_position_to_blender
+from .mesh_utils import mesh_from_arrays, set_object_material, set_vertex_uvs
 
 
 class ImportCombinedZone(bpy.types.Operator, ImportHelper):
@@ -429,7 +430,7 @@ class ImportCombinedZone(bpy.types.Operator, ImportHelper):
             texture_path = self.resolve_mesh_path(zsc_mat.path, base_path)
             if texture_path:
                 try:
-                    tex_node.image = bpy.data.images.load(str(texture_path))
+                    tex_node.image = bpy.data.images.load(str(texture_path), check_existing=True)
                 except Exception:
                     pass
             
@@ -788,10 +789,7 @@ class ImportCombinedZone(bpy.types.Operator, ImportHelper):
         
         # Apply material from cache
         if material_id in material_cache:
-            if len(obj.data.materials) > 0:
-                obj.data.materials[0] = material_cache[material_id]
-            else:
-                obj.data.materials.append(material_cache[material_id])
+            set_object_material(obj, material_cache[material_id])
         
         # Local transform (relative to parent) - no world offset needed
         obj.location = convert_rose_position_to_blender(part.position.x, part.position.y, part.position.z)
@@ -820,22 +818,10 @@ class ImportCombinedZone(bpy.types.Operator, ImportHelper):
             mesh = bpy.data.meshes.new(mesh_name)
             
             # Mesh vertices are in local object space - use as-is from file
-            verts = [(v.position.x, v.position.y, v.position.z) for v in zms.vertices]
-            faces = [(int(i.x), int(i.y), int(i.z)) for i in zms.indices]
-            
-            mesh.from_pydata(verts, [], faces)
+            mesh_from_arrays(mesh, zms.positions_array(), zms.indices_array())
             
             if zms.uv1_enabled() and zms.vertices:
-                uv_layer = mesh.uv_layers.new(name="UVMap")
-                uv_data = uv_layer.data
-                vertices = zms.vertices
-                
-                # Batch process UVs by polygon for better cache locality
-                for poly in mesh.polygons:
-                    for loop_idx in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                        vi = mesh.loops[loop_idx].vertex_index
-                        v = vertices[vi].uv1
-                        uv_data[loop_idx].uv = (v.x, 1.0 - v.y)
+                set_vertex_uvs(mesh, zms.uv_array(1))
             
             mesh.update(calc_edges=True)
             return mesh
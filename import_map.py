@@ -2,23 +2,35 @@ from .rose.him import Him
 from .rose.til import Til
 from .rose.zon import Zon
 from .rose.zsc import Zsc
-from .rose.ifo import Ifo
+from .rose.ifo import Ifo, object_transform_arrays
 from .rose.zms import ZMS
+from .rose.cache import cached_load
 
 from .rose.utils import (
     Vector2, Vector3, list_2d, convert_rose_position_to_blender,
-    apply_uv_rotation, patch_rotation, texture_pair,
+    convert_rose_positions_to_blender, convert_rose_rotations_to_blender,
+    apply_uv_rotation_np, iter_tile_blocks, zon_tile_pair,
+    QUAD_CORNER_U, QUAD_CORNER_V,
 )
+from .mesh_utils import mesh_from_arrays, set_object_material, set_vertex_uvs
 
+import functools
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
 import bpy
+import numpy as np
 from bpy.props import StringProperty, BoolProperty
 from bpy_extras.io_utils import ImportHelper
 
 
+@functools.lru_cache(maxsize=None)
+def _stem(path):
+    """Path(path).stem, memoized: ZSC files repeat the same mesh/texture paths"""
+    return Path(path).stem
+
 class ImportMap(bpy.types.Operator, ImportHelper):
     bl_idname = "import_map.zon"
     bl_label = "Import ROSE map (.zon)"
@@ -53,6 +65,13 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         default=True,
     )
     
+    use_parse_cache: BoolProperty(
+        name="Cache Parsed Files",
+        description="Keep parsed ZON/ZSC/HIM/TIL/IFO data on disk and reuse "
+                    "it while the source file is unchanged (faster re-imports)",
+        default=True,
+    )
+    
     verbose_logging: BoolProperty(
         name="Verbose Logging",
         description="Log warnings for skipped files and errors during import",
@@ -122,11 +141,16 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         """
         materials = []
         pair_to_slot = {}
-        for pair in sorted(texture_pairs):
-            mat = self.create_terrain_material(zon_path, texture_paths, pair[0], pair[1])
-            if mat is not None:
-                pair_to_slot[pair] = len(materials)
-                materials.append(mat)
+        try:
+            for pair in sorted(texture_pairs):
+                mat = self.create_terrain_material(zon_path, texture_paths, pair[0], pair[1])
+                if mat is not None:
+                    pair_to_slot[pair] = len(materials)
+                    materials.append(mat)
+        finally:
+            for template in self._terrain_templates.values():
+                bpy.data.materials.remove(template)
+            self._terrain_templates.clear()
         return materials, pair_to_slot
 
     def create_terrain_material(self, zon_path, texture_paths, l1, l2):
@@ -135,14 +159,10 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         Replicates the game shader (terrain_material.wgsl):
             final = mix(layer1, layer2, layer2.alpha)
         Layer1 samples the plain patch-local UV map; layer2 samples the
-        rotation-adjusted UV map (UVMap_rot).
+        rotation-adjusted UV map (UVMap_rot). The node graph is copied
+        from a template (see _terrain_material_template); only the
+        images differ per material.
         """
-        mat = bpy.data.materials.new(name=f"ROSE_Terrain_{l1}_{l2}")
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
-        nodes.clear()
-
         def load_image(idx):
             if idx >= len(texture_paths):
                 return None
@@ -150,9 +170,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             if not resolved or not Path(resolved).exists():
                 return None
             try:
-                image = bpy.data.images.get(Path(resolved).name)
-                if not image:
-                    image = bpy.data.images.load(resolved)
+                image = bpy.data.images.load(resolved, check_existing=True)
                 # Terrain tiles are sRGB-encoded but must be sampled raw:
                 # Blender's sRGB mipmap pipeline darkens minified samples to
                 # black (double sRGB->linear conversion on mip levels).
@@ -162,6 +180,39 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             except Exception:
                 return None
 
+        image1 = load_image(l1)
+        image2 = load_image(l2) if l2 != l1 else None
+        if image1 is None and image2 is None:
+            return None
+
+        template = self._terrain_material_template(image1 is not None, image2 is not None)
+        mat = template.copy()
+        mat.name = f"ROSE_Terrain_{l1}_{l2}"
+        nodes = mat.node_tree.nodes
+        if image1 is not None:
+            nodes["Layer1"].image = image1
+        if image2 is not None:
+            nodes["Layer2"].image = image2
+        return mat
+
+    def _terrain_material_template(self, has_layer1, has_layer2):
+        """Node graph shared by all terrain materials with the same layers.
+
+        Built once per (has_layer1, has_layer2) combination; the image
+        texture nodes are named "Layer1"/"Layer2" and left empty.
+        Templates are removed again by create_terrain_materials().
+        """
+        key = (has_layer1, has_layer2)
+        template = self._terrain_templates.get(key)
+        if template is not None:
+            return template
+
+        template = bpy.data.materials.new(name="_ROSE_Terrain_Template")
+        template.use_nodes = True
+        nodes = template.node_tree.nodes
+        links = template.node_tree.links
+        nodes.clear()
+
         def connect_color(tex_node, target_socket):
             """tex Color -> Gamma(2.2) -> target (manual sRGB linearization)."""
             gamma = nodes.new(type='ShaderNodeGamma')
@@ -170,30 +221,24 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             links.new(tex_node.outputs['Color'], gamma.inputs['Color'])
             links.new(gamma.outputs['Color'], target_socket)
 
-        image1 = load_image(l1)
-        image2 = load_image(l2) if l2 != l1 else None
-        if image1 is None and image2 is None:
-            bpy.data.materials.remove(mat)
-            return None
-
         output = nodes.new(type='ShaderNodeOutputMaterial')
         output.location = (600, 0)
         bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
         bsdf.location = (300, 0)
 
-        if image2 is not None:
+        if has_layer2:
             tex2 = nodes.new(type='ShaderNodeTexImage')
+            tex2.name = "Layer2"
             tex2.location = (-600, 0)
-            tex2.image = image2
             uv_rot_attr = nodes.new(type='ShaderNodeAttribute')
             uv_rot_attr.attribute_name = 'UVMap_rot'
             uv_rot_attr.location = (-900, -200)
             links.new(uv_rot_attr.outputs['Vector'], tex2.inputs['Vector'])
 
-            if image1 is not None:
+            if has_layer1:
                 tex1 = nodes.new(type='ShaderNodeTexImage')
+                tex1.name = "Layer1"
                 tex1.location = (-900, 0)
-                tex1.image = image1
                 mix = nodes.new(type='ShaderNodeMix')
                 mix.data_type = 'RGBA'
                 mix.location = (-300, 0)
@@ -205,12 +250,13 @@ class ImportMap(bpy.types.Operator, ImportHelper):
                 connect_color(tex2, bsdf.inputs['Base Color'])
         else:
             tex1 = nodes.new(type='ShaderNodeTexImage')
+            tex1.name = "Layer1"
             tex1.location = (-300, 0)
-            tex1.image = image1
             connect_color(tex1, bsdf.inputs['Base Color'])
 
         links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-        return mat
+        self._terrain_templates[key] = template
+        return template
 
     def setup_scene_lighting(self, context):
         """Add a sun light and world ambient so the terrain is visible in
@@ -242,7 +288,30 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         self._texture_path_cache = {}
         self._mesh_path_cache = {}
         self._3ddata_root_cache = None
+        # Search root -> {lowercase file name: path} for every file under
+        # it, built on the first texture/mesh lookup that misses there
+        self._fs_indexes = {}
+        # ZSC materials shared across CNST/DECO files, keyed by
+        # (texture path, alpha_enabled, alpha, two_sided)
+        self._material_by_texpath = {}
+        # Loaded images keyed by resolved path (None = failed to load)
+        self._image_cache = {}
+        # ZMS meshes keyed by resolved file path, shared by every ZSC
+        # mesh id (CNST or DECO) that points at the same file
+        self._mesh_by_path = {}
+        # ZMS meshes still waiting for their mesh.update(calc_edges=True)
+        self._pending_update = []
+        # Terrain material node-graph templates, keyed by (has_layer1, has_layer2)
+        self._terrain_templates = {}
+        # ZSC material node-graph templates, keyed by alpha wiring
+        self._zsc_templates = {}
         
+    def _parse(self, cls, path):
+        """Parse a ROSE file, through the on-disk cache when enabled"""
+        if self.use_parse_cache:
+            return cached_load(cls, path)
+        return cls(str(path))
+
     def _get_3ddata_root(self, zon_filepath):
         """Get 3DDATA root directory with caching."""
         if self._3ddata_root_cache is not None:
@@ -254,7 +323,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         depth = 0
 
         while depth < max_depth:
-            if current.name.upper() == "3DDATA":
+            if current.name.lower() == "3ddata":
                 self._3ddata_root_cache = current
                 return current
             current = current.parent
@@ -262,6 +331,36 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         
         return None
 
+    @staticmethod
+    def _index_files(root):
+        """Map lowercase file name -> path for every file under root.
+
+        Iterative os.scandir walk; entry.is_dir() uses the cached dirent
+        type, so no extra stat per file. The first path seen for a name
+        wins.
+        """
+        index = {}
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            index.setdefault(entry.name.lower(), entry.path)
+            except OSError:
+                continue
+        return index
+
+    def _file_index(self, root):
+        """Case-insensitive file name index of root, walked once per import"""
+        key = str(root)
+        index = self._fs_indexes.get(key)
+        if index is None:
+            index = self._fs_indexes[key] = self._index_files(root)
+        return index
+
     def resolve_texture_path(self, zon_filepath, texture_path):
         """Resolve texture path from ZON to actual file path with caching."""
         # Check cache first
@@ -269,7 +368,6 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         if cache_key in self._texture_path_cache:
             return self._texture_path_cache[cache_key]
         
-        zon_path = Path(zon_filepath).resolve()
         root_3ddata = self._get_3ddata_root(zon_filepath)
 
         if not root_3ddata:
@@ -321,125 +419,18 @@ class ImportMap(bpy.types.Operator, ImportHelper):
                     self._texture_path_cache[cache_key] = result
                     return result
 
-        # Last resort: case-insensitive search with limited scope
-        # Only search in likely texture directories, not entire 3DDATA
-        search_dirs = [d for d in common_dirs if d.exists()]
-        if not search_dirs:
-            search_dirs = [root_3ddata]
-        
-        texture_name_lower = texture_name.lower()
-        for search_dir in search_dirs:
-            try:
-                # Use iterdir for shallow search first
-                for item in search_dir.iterdir():
-                    if item.is_file() and item.name.lower() == texture_name_lower:
-                        result = str(item)
-                        self._texture_path_cache[cache_key] = result
-                        return result
-                    # Shallow search in subdirectories
-                    if item.is_dir():
-                        for subitem in item.iterdir():
-                            if subitem.is_file() and subitem.name.lower() == texture_name_lower:
-                                result = str(subitem)
-                                self._texture_path_cache[cache_key] = result
-                                return result
-            except Exception:
-                continue
+        # Last resort: case-insensitive lookup in a one-time index of
+        # every file under 3DDATA (one scandir walk shared by all textures)
+        result = self._file_index(root_3ddata).get(texture_name.lower())
+        if result:
+            self._texture_path_cache[cache_key] = result
+            return result
 
         self.report({'WARNING'}, f"Texture not found: {texture_relative}")
         self._texture_path_cache[cache_key] = None
         return None
 
 
-    def create_terrain_texture_atlas(self, zon_path, texture_paths):
-        """
-        Create a texture atlas combining all terrain textures.
-        Uses efficient buffer operations instead of per-pixel loops.
-        """
-        import numpy as np
-        
-        # Load all texture images
-        images = []
-        max_width = 0
-        max_height = 0
-        
-        for idx, tex_path in enumerate(texture_paths):
-            resolved_path = self.resolve_texture_path(zon_path, tex_path)
-            if resolved_path and Path(resolved_path).exists():
-                try:
-                    img = bpy.data.images.load(resolved_path)
-                    # Ensure we float buffer for faster access
-                    img.use_half_precision = False
-                    images.append(img)
-                    max_width = max(max_width, img.size[0])
-                    max_height = max(max_height, img.size[1])
-                except Exception as e:
-                    images.append(None)
-            else:
-                images.append(None)
-        
-        # Filter out None images but keep indices
-        valid_images = [(i, img) for i, img in enumerate(images) if img is not None]
-        
-        if not valid_images:
-            return None, {}
-        
-        # Calculate atlas dimensions (4xN grid)
-        textures_per_row = 4
-        num_rows = (len(valid_images) + textures_per_row - 1) // textures_per_row
-        atlas_width = max_width * textures_per_row
-        atlas_height = max_height * num_rows
-        
-        # Create atlas image with numpy for speed
-        atlas_name = "ROSE_Terrain_Atlas"
-        try:
-            atlas = bpy.data.images.new(atlas_name, width=atlas_width, height=atlas_height, alpha=True, float_buffer=True)
-        except Exception as e:
-            return None, {}
-        
-        # Create numpy array for atlas (RGBA)
-        atlas_array = np.zeros((atlas_height, atlas_width, 4), dtype=np.float32)
-        
-        # Build atlas info and copy textures
-        atlas_info = {}
-        for idx, (original_idx, img) in enumerate(valid_images):
-            row = idx // textures_per_row
-            col = idx % textures_per_row
-            x = col * max_width
-            y = row * max_height
-            
-            img_w, img_h = img.size[0], img.size[1]
-            
-            # Get pixels as numpy array (faster than Python loops)
-            # Blender stores as flat RGBA array
-            pixels = np.array(img.pixels[:])
-            img_array = pixels.reshape((img_h, img_w, 4))
-            
-            # Flip Y for Blender's bottom-up coordinate system and place in atlas
-            # Calculate destination coordinates (top-left origin for numpy)
-            dst_y_start = (num_rows - 1 - row) * max_height
-            dst_x_start = col * max_width
-            
-            # Place image (handling different sizes)
-            atlas_array[dst_y_start:dst_y_start + img_h, dst_x_start:dst_x_start + img_w] = img_array
-            
-            # Store atlas region info (UV space, 0-1)
-            atlas_info[original_idx] = {
-                'x': x, 'y': y,
-                'width': img_w, 'height': img_h,
-                'u_min': x / atlas_width,
-                'v_min': y / atlas_height,
-                'u_max': (x + img_w) / atlas_width,
-                'v_max': (y + img_h) / atlas_height
-            }
-        
-        # Assign pixels back to Blender (flatten array)
-        atlas.pixels = atlas_array.flatten().tolist()
-        atlas.update()
-        
-        return atlas, atlas_info
-
-
     def get_map_name(self):
         """Extract map name (planet) from ZON file path.
         
@@ -515,13 +506,6 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             original_use_autopersist = None
             pass
         
-        # Use faster mesh creation method
-        import bmesh
-        
-        # Batch link lists
-        terrain_objects = []
-        object_cache = {}  # For mesh instancing
-
         # Get paths based on file structure
         # Expected: 3DDATA/MAPS/JUNON/JPT01/30_30.ZON
         try:
@@ -534,6 +518,9 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             
             if root_3ddata.name.upper() != "3DDATA":
                 return {'CANCELLED'}
+            # Texture resolution uses this root directly instead of
+            # walking up from the ZON file again
+            self._3ddata_root_cache = root_3ddata
                 
             map_name = self.get_map_name()  # e.g., "JUNON", "ELDEON", "LUNAR"
             zone_code = self.get_zone_code()  # e.g., "JPT", "EJ", "LMT"
@@ -562,7 +549,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             for candidate in cnst_candidates:
                 if candidate.exists():
                     try:
-                        zsc_cnst = Zsc(str(candidate))
+                        zsc_cnst = self._parse(Zsc, candidate)
                         break
                     except Exception as e:
                         if self.verbose_logging:
@@ -591,7 +578,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             for candidate in deco_candidates:
                 if candidate.exists():
                     try:
-                        deco_zsc = Zsc(str(candidate))
+                        deco_zsc = self._parse(Zsc, candidate)
                         zsc_deco_list.append(deco_zsc)
                     except Exception as e:
                         if self.verbose_logging:
@@ -622,7 +609,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
                 til_ext = ".til"
                 ifo_ext = ".ifo"
 
-            zon = Zon(self.filepath)
+            zon = self._parse(Zon, self.filepath)
             zon_dir = os.path.dirname(self.filepath)
 
             # CRITICAL: Convert grid_size (cm) to meters.
@@ -637,24 +624,31 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             tiles.count = 0
             tiles.coords = []
 
-            # Scan directory for HIM files
-            for file in os.listdir(zon_dir):
-                if file.endswith(him_ext):
+            # Scan directory for HIM files (scandir iterates lazily). The
+            # same pass records every file name, so the TIL/IFO existence
+            # checks below are set lookups instead of stat calls.
+            existing = set()
+            with os.scandir(zon_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    existing.add(name)
+                    if not name.endswith(him_ext):
+                        continue
                     try:
-                        x, y = map(int, file.split(".")[0].split("_"))
-                        
-                        # If limit_tiles is enabled, only load the specified tile
-                        if self.limit_tiles and (x != self.tile_x or y != self.tile_y):
-                            continue
-                        
-                        tiles.min_pos.x = min(x, tiles.min_pos.x)
-                        tiles.min_pos.y = min(y, tiles.min_pos.y)
-                        tiles.max_pos.x = max(x, tiles.max_pos.x)
-                        tiles.max_pos.y = max(y, tiles.max_pos.y)
-                        tiles.count += 1
-                        tiles.coords.append((x, y))
-                    except:
+                        x, y = map(int, name.split(".")[0].split("_"))
+                    except ValueError:
                         continue
+                    
+                    # If limit_tiles is enabled, only load the specified tile
+                    if self.limit_tiles and (x != self.tile_x or y != self.tile_y):
+                        continue
+                    
+                    tiles.min_pos.x = min(x, tiles.min_pos.x)
+                    tiles.min_pos.y = min(y, tiles.min_pos.y)
+                    tiles.max_pos.x = max(x, tiles.max_pos.x)
+                    tiles.max_pos.y = max(y, tiles.max_pos.y)
+                    tiles.count += 1
+                    tiles.coords.append((x, y))
 
             if tiles.count == 0:
                 return {'CANCELLED'}
@@ -662,42 +656,62 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             tiles.dimension.x = tiles.max_pos.x - tiles.min_pos.x + 1
             tiles.dimension.y = tiles.max_pos.y - tiles.min_pos.y + 1
 
-            tiles.indices = list_2d(tiles.dimension.y, tiles.dimension.x)
+            # First global vertex index of each tile's (row-major) vertex
+            # grid; vertex (vy, vx) of a tile is base + vy * width + vx.
+            # -1 marks tiles without terrain.
+            tiles.vertex_base = np.full((tiles.dimension.y, tiles.dimension.x), -1, dtype=np.int32)
             tiles.hims = list_2d(tiles.dimension.y, tiles.dimension.x)
             tiles.tils = list_2d(tiles.dimension.y, tiles.dimension.x)
             tiles.ifos = list_2d(tiles.dimension.y, tiles.dimension.x)
 
-            # Load HIM/TIL/IFO files
-            for x, y in tiles.coords:
+            # Load HIM/TIL/IFO files. Tiles are independent, so they are
+            # parsed on a thread pool (overlapping the file reads); results
+            # and messages are placed/reported on the main thread, and
+            # the worker never touches bpy (operator properties included).
+            parse = cached_load if self.use_parse_cache else (lambda cls, path: cls(str(path)))
+
+            def load_tile(coord):
+                x, y = coord
                 tile_name = "{}_{}".format(x, y)
                 him_file = os.path.join(zon_dir, tile_name + him_ext)
                 til_file = os.path.join(zon_dir, tile_name + til_ext)
                 ifo_file = os.path.join(zon_dir, tile_name + ifo_ext)
+                messages = []
 
-                norm_x = x - tiles.min_pos.x
-                norm_y = y - tiles.min_pos.y
+                if tile_name + til_ext not in existing:
+                    messages.append(f"Failed to load tile {tile_name}: missing {til_file}")
+                    return x, y, None, None, None, messages
 
                 try:
-                    him = Him(him_file)
-                    til = Til(til_file)
-                    him.indices = list_2d(him.width, him.length)
-                    
-                    # Load IFO if exists
-                    ifo = None
-                    if os.path.exists(ifo_file):
-                        try:
-                            ifo = Ifo(ifo_file)
-                        except Exception as e:
-                            if self.verbose_logging:
-                                self.report({'WARNING'}, f"Failed to load IFO {ifo_file}: {str(e)}")
-
-                    tiles.indices[norm_y][norm_x] = list_2d(him.width, him.length)
-                    tiles.hims[norm_y][norm_x] = him
-                    tiles.tils[norm_y][norm_x] = til
-                    tiles.ifos[norm_y][norm_x] = ifo
+                    him = parse(Him, him_file)
+                    til = parse(Til, til_file)
                 except Exception as e:
-                    if self.verbose_logging:
-                        self.report({'WARNING'}, f"Failed to load tile {tile_name}: {str(e)}")
+                    messages.append(f"Failed to load tile {tile_name}: {str(e)}")
+                    return x, y, None, None, None, messages
+
+                # Load IFO if exists
+                ifo = None
+                if tile_name + ifo_ext in existing:
+                    try:
+                        ifo = parse(Ifo, ifo_file)
+                    except Exception as e:
+                        messages.append(f"Failed to load IFO {ifo_file}: {str(e)}")
+                return x, y, him, til, ifo, messages
+
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+                loaded = list(pool.map(load_tile, tiles.coords))
+
+            for x, y, him, til, ifo, messages in loaded:
+                if self.verbose_logging:
+                    for message in messages:
+                        self.report({'WARNING'}, message)
+                if him is None:
+                    continue
+                norm_x = x - tiles.min_pos.x
+                norm_y = y - tiles.min_pos.y
+                tiles.hims[norm_y][norm_x] = him
+                tiles.tils[norm_y][norm_x] = til
+                tiles.ifos[norm_y][norm_x] = ifo
 
             wm.progress_update(30)
             t = record_time("Load tile data", t)
@@ -709,151 +723,224 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             # Terrain and IFO objects share this space: object pos is cm / 100.
             block_size = 64.0 * grid_scale
             world_origin = -32.5 * block_size
-            vertices = []
-            edges = []
-            faces = []
-            # Per-face patch-local UVs: ((u,v) x4 corners, layer2 rotation)
-            face_uvs = []
+            # Sizes are known once the tiles are loaded, so the vertex and
+            # main quad arrays are allocated once and filled per tile;
+            # stitch quads (appended after all main quads) are collected
+            # as chunks
+            loaded_hims = [him for row in tiles.hims for him in row if him]
+            vertices = np.empty((sum(him.width * him.length for him in loaded_hims), 3),
+                                dtype=np.float32)
+            main_faces = np.empty((sum((him.width - 1) * (him.length - 1) for him in loaded_hims), 4),
+                                  dtype=np.int32)
+            face_chunks = [main_faces]
+            # Per-face patch-local corner UVs and layer2 rotation, in the
+            # same (main quads, then stitch chunks) order as the faces
+            main_uvs = np.empty((len(main_faces), 4, 2), dtype=np.float32)
+            main_rotations = np.empty(len(main_faces), dtype=np.int32)
+            uv_chunks = [main_uvs]
+            rotation_chunks = [main_rotations]
+            n_verts = 0
+            n_faces = 0
+            # First face index of each tile's main quads / stitch quads, so
+            # later per-face passes don't depend on the emission order
+            tiles.face_base = np.full((tiles.dimension.y, tiles.dimension.x), -1, dtype=np.int32)
+            tiles.stitch_base = np.full((tiles.dimension.y, tiles.dimension.x), -1, dtype=np.int32)
+            # Patch -> ZON tile index of every TIL patch, as one
+            # (dim_y, dim_x, patch rows, patch cols) array. Out-of-range
+            # tile indices are clamped to n_zon_tiles and tiles without a
+            # TIL hold -1; both hit the trailing "none" entry of the
+            # per-ZON-tile tables (rotation_lut, slot_lut). A smaller TIL
+            # is edge-padded, which matches clamping patch coordinates to
+            # its own size.
+            n_zon_tiles = len(zon.tiles)
+            til_grids = {}
+            for y in range(tiles.dimension.y):
+                for x in range(tiles.dimension.x):
+                    til = tiles.tils[y][x]
+                    if tiles.hims[y][x] and til and til.tiles:
+                        til_grids[y, x] = til.tile_indices_np()
+            patch_rows = max((g.shape[0] for g in til_grids.values()), default=1)
+            patch_cols = max((g.shape[1] for g in til_grids.values()), default=1)
+            tiles.patch_tiles = np.full(
+                (tiles.dimension.y, tiles.dimension.x, patch_rows, patch_cols), -1, dtype=np.int64)
+            for (y, x), grid in til_grids.items():
+                tiles.patch_tiles[y, x] = np.pad(
+                    np.minimum(grid, n_zon_tiles),
+                    ((0, patch_rows - grid.shape[0]), (0, patch_cols - grid.shape[1])), mode='edge')
+
+            # ZON tile index -> layer2 rotation (trailing entry: 1 = None,
+            # as in patch_rotation), gathered for every patch at once
+            rotation_lut = np.array([t.rotation for t in zon.tiles] + [1], dtype=np.int32)
+            tiles.patch_rotations = rotation_lut[tiles.patch_tiles]
 
             for y in range(tiles.dimension.y):
                 for x in range(tiles.dimension.x):
                     if not tiles.hims[y][x]:
                         continue
                         
-                    indices = tiles.indices[y][x]
                     him = tiles.hims[y][x]
-                    til = tiles.tils[y][x]
+                    tiles.face_base[y, x] = n_faces
                     block_x = x + tiles.min_pos.x
                     block_y = y + tiles.min_pos.y
                     base_x = block_x * block_size + world_origin
                     base_y = block_y * block_size + world_origin
-
-                    for vy in range(him.length):
-                        for vx in range(him.width):
-                            # Both Rose and Blender use Z-up coordinate systems.
-                            # Object conversion uses (x, -y, z) / 100, and the
-                            # client terrain formula already folds in the Y flip,
-                            # so terrain Y is not negated again here.
-                            height = him.heights[vy][vx] / 100.0
-                            
-                            world_x = base_x + vx * grid_scale
-                            world_y = base_y + vy * grid_scale
-                            
-                            vertices.append((world_x, world_y, height))
-                            vi = len(vertices) - 1
-                            him.indices[vy][vx] = vi
-                            indices[vy][vx] = vi
-
-                            if vx < him.width - 1 and vy < him.length - 1:
-                                v1 = vi
-                                v2 = vi + 1
-                                v3 = vi + 1 + him.width
-                                v4 = vi + him.width
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                # Patch-local UVs (matching the client's uv1 = [x/4, y/4])
-                                px, py = vx // 4, vy // 4
-                                u0 = (vx - px * 4) / 4.0
-                                v0 = (vy - py * 4) / 4.0
-                                face_uvs.append((
-                                    ((u0, v0),
-                                     (u0 + 0.25, v0),
-                                     (u0 + 0.25, v0 + 0.25),
-                                     (u0, v0 + 0.25)),
-                                    patch_rotation(til, zon, px, py),
-                                ))
+                    h, w = him.length, him.width
+
+                    # Whole-tile vertex grid, row-major (vy, vx).
+                    # Both Rose and Blender use Z-up coordinate systems.
+                    # Object conversion uses (x, -y, z) / 100, and the
+                    # client terrain formula already folds in the Y flip,
+                    # so terrain Y is not negated again here.
+                    tile_verts = vertices[n_verts:n_verts + h * w].reshape(h, w, 3)
+                    tile_verts[:, :, 0] = base_x + np.arange(w) * grid_scale
+                    tile_verts[:, :, 1] = (base_y + np.arange(h) * grid_scale)[:, None]
+                    tile_verts[:, :, 2] = np.asarray(him.heights, dtype=np.float64) / 100.0
+
+                    # Quad corners (v1, v2, v3, v4) for every cell
+                    tiles.vertex_base[y, x] = n_verts
+                    q = n_verts + (np.arange(h - 1, dtype=np.int32)[:, None] * w
+                                   + np.arange(w - 1, dtype=np.int32))
+                    tile_faces = main_faces[n_faces:n_faces + (h - 1) * (w - 1)].reshape(h - 1, w - 1, 4)
+                    tile_faces[:, :, 0] = q
+                    tile_faces[:, :, 1] = q + 1
+                    tile_faces[:, :, 2] = q + 1 + w
+                    tile_faces[:, :, 3] = q + w
+
+                    # Patch-local UVs (matching the client's uv1 = [x/4, y/4]):
+                    # each quad covers a quarter of its patch
+                    tile_uvs = main_uvs[n_faces:n_faces + (h - 1) * (w - 1)].reshape(h - 1, w - 1, 4, 2)
+                    tile_uvs[..., 0] = (np.arange(w - 1) % 4 / 4.0)[None, :, None] + QUAD_CORNER_U
+                    tile_uvs[..., 1] = (np.arange(h - 1) % 4 / 4.0)[:, None, None] + QUAD_CORNER_V
+
+                    # Quad column/row -> (clamped) patch rotation
+                    rotations = tiles.patch_rotations[y, x]
+                    cx = np.minimum(np.arange(w - 1) // 4, rotations.shape[1] - 1)
+                    cy = np.minimum(np.arange(h - 1) // 4, rotations.shape[0] - 1)
+                    main_rotations[n_faces:n_faces + (h - 1) * (w - 1)] = \
+                        rotations[np.ix_(cy, cx)].ravel()
+
+                    n_verts += h * w
+                    n_faces += (h - 1) * (w - 1)
+
+            # Which neighbors each tile is stitched to. Connections to
+            # neighboring tiles that don't exist on disk are skipped (zones
+            # are sparse grids; missing tiles are skipped like the Rust
+            # client). The material pass reads the same masks.
+            loaded = tiles.vertex_base >= 0
+            tiles.has_x_neighbor = np.zeros_like(loaded)
+            tiles.has_x_neighbor[:, :-1] = loaded[:, :-1] & loaded[:, 1:]
+            tiles.has_y_neighbor = np.zeros_like(loaded)
+            tiles.has_y_neighbor[:-1, :] = loaded[:-1, :] & loaded[1:, :]
+            tiles.has_xy_neighbor = np.zeros_like(loaded)
+            tiles.has_xy_neighbor[:-1, :-1] = (tiles.has_x_neighbor[:-1, :-1]
+                                               & tiles.has_y_neighbor[:-1, :-1]
+                                               & loaded[1:, 1:])
 
             # Generate inter-tile connections
             for y in range(tiles.dimension.y):
                 for x in range(tiles.dimension.x):
-                    if not tiles.hims[y][x] or not tiles.indices[y][x]:
+                    if not loaded[y, x]:
                         continue
-                        
-                    indices = tiles.indices[y][x]
+
+                    base = int(tiles.vertex_base[y, x])
                     him = tiles.hims[y][x]
-                    is_x_edge = (x == tiles.dimension.x - 1)
-                    is_y_edge = (y == tiles.dimension.y - 1)
-
-                    # Skip connections to neighboring tiles that don't exist on disk
-                    # (zones are sparse grids; missing tiles are skipped like the Rust client)
-                    has_x_neighbor = not is_x_edge and bool(tiles.indices[y][x + 1])
-                    has_y_neighbor = not is_y_edge and bool(tiles.indices[y + 1][x])
-                    has_xy_neighbor = has_x_neighbor and has_y_neighbor and bool(tiles.indices[y + 1][x + 1])
-
-                    for vy in range(him.length):
-                        for vx in range(him.width):
-                            is_x_edge_vertex = (vx == him.width - 1) and (vy < him.length - 1)
-                            is_y_edge_vertex = (vx < him.width - 1) and (vy == him.length - 1)
-                            is_corner_vertex = (vx == him.width - 1) and (vy == him.length - 1)
-
-                            if has_x_neighbor and is_x_edge_vertex:
-                                next_indices = tiles.indices[y][x + 1]
-                                v1 = indices[vy][vx]
-                                v2 = next_indices[vy][0]
-                                v3 = next_indices[vy + 1][0]
-                                v4 = indices[vy + 1][vx]
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                # Edge stitch quad is degenerate in world space;
-                                # give it the edge patch's UVs
-                                px, py = min(vx // 4, 15), vy // 4
-                                va = (vy - py * 4) / 4.0
-                                vb = (vy + 1 - py * 4) / 4.0
-                                face_uvs.append((
-                                    ((1.0, va), (0.0, va), (0.0, vb), (1.0, vb)),
-                                    patch_rotation(til, zon, px, py),
-                                ))
-
-                            if has_y_neighbor and is_y_edge_vertex:
-                                next_indices = tiles.indices[y + 1][x]
-                                v1 = indices[vy][vx]
-                                v2 = indices[vy][vx + 1]
-                                v3 = next_indices[0][vx + 1]
-                                v4 = next_indices[0][vx]
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                px, py = vx // 4, min(vy // 4, 15)
-                                ua = (vx - px * 4) / 4.0
-                                ub = (vx + 1 - px * 4) / 4.0
-                                face_uvs.append((
-                                    ((ua, 1.0), (ub, 1.0), (ub, 0.0), (ua, 0.0)),
-                                    patch_rotation(til, zon, px, py),
-                                ))
-
-                            if has_xy_neighbor and is_corner_vertex:
-                                right = tiles.indices[y][x + 1]
-                                diag = tiles.indices[y + 1][x + 1]
-                                down = tiles.indices[y + 1][x]
-                                diag_him = tiles.hims[y + 1][x + 1]
-                                down_him = tiles.hims[y + 1][x]
-
-                                v1 = indices[vy][vx]
-                                v2 = right[diag_him.length - 1][0]
-                                v3 = diag[0][0]
-                                v4 = down[0][down_him.width - 1]
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                face_uvs.append((
-                                    ((1.0, 1.0), (1.0, 1.0), (1.0, 1.0), (1.0, 1.0)),
-                                    patch_rotation(til, zon, 15, 15),
-                                ))
+                    has_x_neighbor = tiles.has_x_neighbor[y, x]
+                    has_y_neighbor = tiles.has_y_neighbor[y, x]
+                    has_xy_neighbor = tiles.has_xy_neighbor[y, x]
+                    tiles.stitch_base[y, x] = n_faces
+                    rotations = tiles.patch_rotations[y, x]
+                    h, w = him.length, him.width
+                    # Patch row/column of the stitch edges (patch_rotation
+                    # clamping: first to 15, then to the TIL size)
+                    edge_px = min((w - 1) // 4, 15, rotations.shape[1] - 1)
+                    edge_py = min((h - 1) // 4, 15, rotations.shape[0] - 1)
+                    # Stitch quads are emitted X edge, then Y edge, then
+                    # corner; the material pass relies on this order.
+                    stitch_chunks = []
+
+                    if has_x_neighbor:
+                        # Right column of this tile -> left column of the next
+                        col = base + np.arange(h, dtype=np.int32) * w + (w - 1)
+                        next_col = (tiles.vertex_base[y, x + 1]
+                                    + np.arange(h, dtype=np.int32) * tiles.hims[y][x + 1].width)
+                        stitch_chunks.append(np.stack(
+                            (col[:h - 1], next_col[:h - 1], next_col[1:h], col[1:h]), axis=-1))
+                        # Edge stitch quad is degenerate in world space;
+                        # give it the edge patch's UVs
+                        va = np.arange(h - 1) % 4 / 4.0
+                        uvs = np.empty((h - 1, 4, 2), dtype=np.float32)
+                        uvs[:, :, 0] = (1.0, 0.0, 0.0, 1.0)
+                        uvs[:, :, 1] = va[:, None] + QUAD_CORNER_V
+                        uv_chunks.append(uvs)
+                        cy = np.minimum(np.arange(h - 1) // 4, rotations.shape[0] - 1)
+                        rotation_chunks.append(rotations[cy, edge_px])
+
+                    if has_y_neighbor:
+                        # Bottom row of this tile -> top row of the next
+                        row = base + (h - 1) * w + np.arange(w, dtype=np.int32)
+                        next_row = tiles.vertex_base[y + 1, x] + np.arange(w, dtype=np.int32)
+                        stitch_chunks.append(np.stack(
+                            (row[:w - 1], row[1:w], next_row[1:w], next_row[:w - 1]), axis=-1))
+                        ua = np.arange(w - 1) % 4 / 4.0
+                        uvs = np.empty((w - 1, 4, 2), dtype=np.float32)
+                        uvs[:, :, 0] = ua[:, None] + QUAD_CORNER_U
+                        uvs[:, :, 1] = (1.0, 1.0, 0.0, 0.0)
+                        uv_chunks.append(uvs)
+                        cx = np.minimum(np.arange(w - 1) // 4, rotations.shape[1] - 1)
+                        rotation_chunks.append(rotations[edge_py, cx])
+
+                    if has_xy_neighbor:
+                        right_him = tiles.hims[y][x + 1]
+                        diag_him = tiles.hims[y + 1][x + 1]
+                        down_him = tiles.hims[y + 1][x]
+                        stitch_chunks.append(np.array([[
+                            base + (h - 1) * w + (w - 1),
+                            tiles.vertex_base[y, x + 1] + (diag_him.length - 1) * right_him.width,
+                            tiles.vertex_base[y + 1, x + 1],
+                            tiles.vertex_base[y + 1, x] + down_him.width - 1,
+                        ]], dtype=np.int32))
+                        uv_chunks.append(np.ones((1, 4, 2), dtype=np.float32))
+                        rotation_chunks.append(rotations[min(15, rotations.shape[0] - 1),
+                                                        min(15, rotations.shape[1] - 1)].reshape(1))
+
+                    for chunk in stitch_chunks:
+                        face_chunks.append(chunk)
+                        n_faces += len(chunk)
 
             # Create terrain mesh
             mesh = bpy.data.meshes.new("ROSE_Terrain")
-            mesh.from_pydata(vertices, edges, faces)
-            mesh.update()
+            # Edges are calculated by the mesh.update() after the material pass
+            mesh_from_arrays(mesh, vertices, np.concatenate(face_chunks), update=False)
 
             # UV maps matching the game: uv1 = patch-local 0..1 per TIL patch,
             # UVMap_rot = same coords with the patch's layer2 rotation applied.
+            # Every face is a quad, so face i owns loops 4*i .. 4*i+3 and
+            # the per-corner arrays can be written in one call each.
+            face_uv = np.concatenate(uv_chunks)
+            face_rotations = np.concatenate(rotation_chunks)
+
+            # Faces are independent, so the rotation runs on disjoint face
+            # ranges in a thread pool (NumPy releases the GIL) and writes
+            # straight into one output buffer
+            rotated_uv = np.empty_like(face_uv)
+            n_chunks = max(1, min(os.cpu_count() or 1, len(face_uv) // 65536))
+            bounds = np.linspace(0, len(face_uv), n_chunks + 1, dtype=np.int64)
+
+            def rotate_faces(i):
+                start, end = bounds[i], bounds[i + 1]
+                rotated_uv[start:end] = apply_uv_rotation_np(
+                    face_uv[start:end], face_rotations[start:end, None])
+
+            if n_chunks == 1:
+                rotate_faces(0)
+            else:
+                with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+                    list(pool.map(rotate_faces, range(n_chunks)))
+
             uv_layer = mesh.uv_layers.new(name="UVMap")
             uv2_layer = mesh.uv_layers.new(name="UVMap_rot")
-            for fi, (corners, rotation) in enumerate(face_uvs):
-                poly = mesh.polygons[fi]
-                for li in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                    corner = li - poly.loop_start
-                    u, v = corners[corner]
-                    uv_layer.data[li].uv = (u, v)
-                    uv2_layer.data[li].uv = apply_uv_rotation(u, v, rotation)
+            uv_layer.data.foreach_set("uv", face_uv.ravel())
+            uv2_layer.data.foreach_set("uv", rotated_uv.ravel())
 
             wm.progress_update(50)
             
@@ -863,23 +950,10 @@ class ImportMap(bpy.types.Operator, ImportHelper):
                 # Collect the distinct (layer1, layer2) texture pairs used by
                 # the map's TIL patches (matching the Rust client's two-layer
                 # blending; see terrain.rs and terrain_material.wgsl).
-                texture_pairs = set()
-                for ty in range(int(tiles.dimension.y)):
-                    for tx in range(int(tiles.dimension.x)):
-                        til = tiles.tils[ty][tx]
-                        if not til or not til.tiles:
-                            continue
-                        for row in til.tiles:
-                            for patch in row:
-                                if patch.tile < len(zon.tiles):
-                                    ztile = zon.tiles[patch.tile]
-                                    l1 = ztile.layer1 + ztile.offset1
-                                    l2 = ztile.layer2 + ztile.offset2
-                                    if l1 >= len(zon.textures):
-                                        l1 = l2
-                                    if l2 >= len(zon.textures):
-                                        l2 = l1
-                                    texture_pairs.add((l1, l2))
+                n_textures = len(zon.textures)
+                tile_pairs = [zon_tile_pair(t, n_textures) for t in zon.tiles]
+                used_tiles = np.unique(tiles.patch_tiles).tolist()
+                texture_pairs = {tile_pairs[t] for t in used_tiles if 0 <= t < len(tile_pairs)}
                 
                 # Create materials, one per texture pair
                 texture_materials, pair_to_slot = self.create_terrain_materials(
@@ -891,73 +965,66 @@ class ImportMap(bpy.types.Operator, ImportHelper):
                         mesh.materials.append(mat)
                     
                     # Build material index array for all faces at once
-                    material_indices = [0] * len(faces)
-                    face_idx = 0
-
-                    # Single pass: compute material for each face type
-                    for ty in range(int(tiles.dimension.y)):
-                        for tx in range(int(tiles.dimension.x)):
-                            if not tiles.hims[ty][tx]:
-                                continue
-                            
-                            him = tiles.hims[ty][tx]
-                            til = tiles.tils[ty][tx]
-                            is_x_edge = (tx == tiles.dimension.x - 1)
-                            is_y_edge = (ty == tiles.dimension.y - 1)
-
-                            # Must mirror the stitching loop: only count faces
-                            # for neighbors that actually exist on disk
-                            has_x_neighbor = not is_x_edge and bool(tiles.indices[ty][tx + 1])
-                            has_y_neighbor = not is_y_edge and bool(tiles.indices[ty + 1][tx])
-                            has_xy_neighbor = has_x_neighbor and has_y_neighbor and bool(tiles.indices[ty + 1][tx + 1])
-
-                            def slot_for(px, py):
-                                pair = texture_pair(til, zon, px, py, len(zon.textures))
-                                if pair is None:
-                                    return None
-                                return pair_to_slot.get(pair)
-
-                            # Main tile faces
-                            # TIL is a 16x16 patch grid; each patch covers a 4x4
-                            # quad area of the 64x64 heightmap grid (matching the
-                            # Rust client's tile_x = tilemap.width * block_x.fract()).
-                            for vy in range(him.length - 1):
-                                for vx in range(him.width - 1):
-                                    if face_idx < len(faces) and til and til.tiles:
-                                        slot = slot_for(vx // 4, vy // 4)
-                                        if slot is not None:
-                                            material_indices[face_idx] = slot
-                                    face_idx += 1
-                            
-                            # Inter-tile X edge faces
-                            if has_x_neighbor:
-                                for vy in range(him.length - 1):
-                                    if face_idx < len(faces) and til and til.tiles:
-                                        slot = slot_for((him.width - 1) // 4, vy // 4)
-                                        if slot is not None:
-                                            material_indices[face_idx] = slot
-                                    face_idx += 1
-                            
-                            # Inter-tile Y edge faces
-                            if has_y_neighbor:
-                                for vx in range(him.width - 1):
-                                    if face_idx < len(faces) and til and til.tiles:
-                                        slot = slot_for(vx // 4, (him.length - 1) // 4)
-                                        if slot is not None:
-                                            material_indices[face_idx] = slot
-                                    face_idx += 1
-                            
-                            # Corner faces
-                            if has_xy_neighbor:
-                                if face_idx < len(faces) and til and til.tiles:
-                                    slot = slot_for((him.width - 1) // 4, (him.length - 1) // 4)
-                                    if slot is not None:
-                                        material_indices[face_idx] = slot
-                                face_idx += 1
-                    
-                    # Batch assign material indices to polygons
-                    for i, mat_idx in enumerate(material_indices):
-                        mesh.polygons[i].material_index = mat_idx
+                    # (faces without a material keep slot 0). The face and
+                    # stitch ranges below are the ones recorded while the
+                    # faces were emitted, so they always lie inside it.
+                    if len(mesh.polygons) != n_faces:
+                        raise RuntimeError(f"Terrain mesh has {len(mesh.polygons)} faces, expected {n_faces}")
+                    material_indices = np.zeros(n_faces, dtype=np.int32)
+
+                    # ZON tile index -> material slot (-1 = no material), so
+                    # a whole TIL grid maps to slots with one gather
+                    slot_lut = np.full(n_zon_tiles + 1, -1, dtype=np.int32)
+                    for tile_idx, pair in enumerate(tile_pairs):
+                        slot = pair_to_slot.get(pair)
+                        if slot is not None:
+                            slot_lut[tile_idx] = slot
+
+                    # Walk the tile grid in TILE_BLOCK x TILE_BLOCK blocks so
+                    # each block's HIM/TIL objects stay hot while their faces
+                    # are processed; face indices come from the per-tile bases
+                    # recorded during mesh generation.
+                    for tx, ty in iter_tile_blocks(int(tiles.dimension.x), int(tiles.dimension.y)):
+                        him = tiles.hims[ty][tx]
+                        til = tiles.tils[ty][tx]
+                        if not him or not til or not til.tiles:
+                            continue
+                        has_x_neighbor = tiles.has_x_neighbor[ty, tx]
+                        has_y_neighbor = tiles.has_y_neighbor[ty, tx]
+                        has_xy_neighbor = tiles.has_xy_neighbor[ty, tx]
+
+                        # Material slot of every TIL patch (out-of-range ZON
+                        # tile indices hit the trailing -1 entry)
+                        patch_slots = slot_lut[tiles.patch_tiles[ty, tx]]
+
+                        # TIL is a 16x16 patch grid; each patch covers a 4x4
+                        # quad area of the 64x64 heightmap grid (matching the
+                        # Rust client's tile_x = tilemap.width * block_x.fract()).
+                        # Heightmap column/row -> clamped TIL patch index.
+                        h, w = him.length, him.width
+                        cx = np.minimum(np.arange(w) // 4, patch_slots.shape[1] - 1)
+                        cy = np.minimum(np.arange(h) // 4, patch_slots.shape[0] - 1)
+
+                        # Main faces (row-major), then stitches in emission
+                        # order: X edge, Y edge, corner
+                        groups = [(tiles.face_base[ty, tx], patch_slots[np.ix_(cy[:h - 1], cx[:w - 1])])]
+                        stitch = []
+                        if has_x_neighbor:
+                            stitch.append(patch_slots[cy[:h - 1], cx[w - 1]])
+                        if has_y_neighbor:
+                            stitch.append(patch_slots[cy[h - 1], cx[:w - 1]])
+                        if has_xy_neighbor:
+                            stitch.append(patch_slots[cy[h - 1], cx[w - 1]].reshape(1))
+                        if stitch:
+                            groups.append((tiles.stitch_base[ty, tx], np.concatenate(stitch)))
+
+                        for face_start, slots in groups:
+                            slots = slots.ravel()
+                            face_slice = material_indices[face_start:face_start + len(slots)]
+                            np.copyto(face_slice, slots, where=slots >= 0)
+
+                    # Assign all material indices in one call
+                    mesh.polygons.foreach_set("material_index", material_indices)
 
             mesh.update(calc_edges=True)
 
@@ -973,11 +1040,14 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             if self.setup_lighting:
                 self.setup_scene_lighting(context)
             
-            # Create collections for objects
+            # Create collections for objects. Spawned objects are collected
+            # in lists and linked in one pass at the end, and the
+            # collections join the scene only after they are filled, so
+            # the view layer is resynced once instead of per object.
             cnst_collection = bpy.data.collections.new("CNST_Objects")
             deco_collection = bpy.data.collections.new("DECO_Objects")
-            context.scene.collection.children.link(cnst_collection)
-            context.scene.collection.children.link(deco_collection)
+            cnst_objects = []
+            deco_objects = []
             
             # Spawn objects from IFO files (only for loaded tiles)
             material_cache_cnst = {}
@@ -985,9 +1055,12 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             mesh_cache_cnst = {}
             mesh_cache_deco = {}
             
-            # First pass: collect which object IDs are actually used and pre-load materials
-            used_cnst_objects = set()
-            used_deco_objects = set()
+            # Single walk over the loaded tiles: gather every object instance
+            # as (block_x, block_y, ifo_index, instance). The used object ids
+            # (for material pre-loading) and the spawn loops both come from
+            # these lists, so the tile grid is only traversed once.
+            all_cnst_insts = []
+            all_deco_insts = []
             
             for y in range(tiles.dimension.y):
                 for x in range(tiles.dimension.x):
@@ -998,115 +1071,128 @@ class ImportMap(bpy.types.Operator, ImportHelper):
                     if not ifo:
                         continue
                     
+                    block_x = x + tiles.min_pos.x
+                    block_y = y + tiles.min_pos.y
                     if self.load_cnst_objects:
-                        for obj_inst in ifo.cnst_objects:
-                            used_cnst_objects.add(obj_inst.object_id)
-                    
+                        all_cnst_insts.extend(
+                            (block_x, block_y, i, inst) for i, inst in enumerate(ifo.cnst_objects))
                     if self.load_deco_objects:
-                        for obj_inst in ifo.deco_objects:
-                            used_deco_objects.add(obj_inst.object_id)
+                        all_deco_insts.extend(
+                            (block_x, block_y, i, inst) for i, inst in enumerate(ifo.deco_objects))
             
+            used_cnst_objects = {inst.object_id for (_, _, _, inst) in all_cnst_insts}
+            used_deco_objects = {inst.object_id for (_, _, _, inst) in all_deco_insts}
+
+            # Instance transforms as arrays; the Rose -> Blender position
+            # conversion runs once per object type instead of per spawn
+            cnst_pos, cnst_rot, cnst_scale = object_transform_arrays([i for *_, i in all_cnst_insts])
+            deco_pos, deco_rot, deco_scale = object_transform_arrays([i for *_, i in all_deco_insts])
+            cnst_loc = convert_rose_positions_to_blender(cnst_pos).tolist()
+            deco_loc = convert_rose_positions_to_blender(deco_pos).tolist()
+            cnst_quat = convert_rose_rotations_to_blender(cnst_rot).tolist()
+            deco_quat = convert_rose_rotations_to_blender(deco_rot).tolist()
+            cnst_scale = cnst_scale.tolist()
+            deco_scale = deco_scale.tolist()
             
             # Pre-create materials only for used objects
             if zsc_cnst:
-                used_materials = set()
-                for obj_id in used_cnst_objects:
-                    if obj_id < len(zsc_cnst.objects):
-                        for part in zsc_cnst.objects[obj_id].parts:
-                            used_materials.add(part.material_id)
-                
-                for mat_id in used_materials:
+                for mat_id in zsc_cnst.used_material_ids(used_cnst_objects).tolist():
                     if mat_id < len(zsc_cnst.materials):
                         material_cache_cnst[mat_id] = self.create_zsc_material(zsc_cnst.materials[mat_id], root_3ddata)
             
-            # Pre-load materials from ALL DECO ZSC files
+            # DECO object id -> first DECO ZSC file that contains it,
+            # resolved once per used id instead of once per instance
+            deco_target = {}
+            for object_id in used_deco_objects:
+                for zsc_deco in zsc_deco_list:
+                    if object_id < len(zsc_deco.objects):
+                        deco_target[object_id] = zsc_deco
+                        break
+
+            # Pre-load materials from ALL DECO ZSC files, one cache per
+            # file (material ids collide between files)
             for zsc_deco in zsc_deco_list:
-                used_materials = set()
-                for obj_id in used_deco_objects:
-                    if obj_id < len(zsc_deco.objects):
-                        for part in zsc_deco.objects[obj_id].parts:
-                            used_materials.add(part.material_id)
-                
-                for mat_id in used_materials:
+                file_cache = material_cache_deco[id(zsc_deco)] = {}
+                object_ids = [oid for oid, target in deco_target.items() if target is zsc_deco]
+                for mat_id in zsc_deco.used_material_ids(object_ids).tolist():
                     if mat_id < len(zsc_deco.materials):
-                        # Use tuple of (zsc_file_index, mat_id) as key to avoid collisions between files
-                        cache_key = (id(zsc_deco), mat_id)
-                        material_cache_deco[cache_key] = self.create_zsc_material(zsc_deco.materials[mat_id], root_3ddata)
+                        file_cache[mat_id] = self.create_zsc_material(zsc_deco.materials[mat_id], root_3ddata)
             
             # Spawn objects
             total_cnst = 0
             total_deco = 0
             
-            for y in range(tiles.dimension.y):
-                for x in range(tiles.dimension.x):
-                    # Skip if this tile wasn't loaded
-                    if tiles.hims[y][x] is None:
-                        continue
-                        
-                    ifo = tiles.ifos[y][x]
-                    if not ifo:
+            # Spawn CNST objects
+            if zsc_cnst:
+                for k, (block_x, block_y, obj_index, obj_inst) in enumerate(all_cnst_insts):
+                    if obj_inst.object_id >= len(zsc_cnst.objects):
                         continue
                     
-                    # Spawn CNST objects
-                    if self.load_cnst_objects and zsc_cnst:
-                        block_x = x + tiles.min_pos.x
-                        block_y = y + tiles.min_pos.y
-                        for obj_index, obj_inst in enumerate(ifo.cnst_objects):                            
-                            if obj_inst.object_id >= len(zsc_cnst.objects):
-                                pass
-                                continue
-                            
-                            self.spawn_object(
-                                context, cnst_collection, zsc_cnst, obj_inst,
-                                material_cache_cnst, mesh_cache_cnst, root_3ddata,
-                                block_x=block_x, block_y=block_y,
-                                ifo_block_type="CNST", ifo_index=obj_index
-                            )
-                            total_cnst += 1
+                    self.spawn_object(
+                        context, cnst_objects, zsc_cnst, obj_inst,
+                        material_cache_cnst, mesh_cache_cnst, root_3ddata,
+                        block_x=block_x, block_y=block_y,
+                        ifo_block_type="CNST", ifo_index=obj_index,
+                        location=cnst_loc[k], rotation=cnst_quat[k], scale=cnst_scale[k]
+                    )
+                    total_cnst += 1
+            
+            # Spawn DECO objects (check all loaded DECO ZSC files)
+            if zsc_deco_list:
+                for k, (block_x, block_y, obj_index, obj_inst) in enumerate(all_deco_insts):
+                    target_zsc = deco_target.get(obj_inst.object_id)
+                    if not target_zsc:
+                        continue
                     
-                    # Spawn DECO objects (check all loaded DECO ZSC files)
-                    if self.load_deco_objects and zsc_deco_list:
-                        block_x = x + tiles.min_pos.x
-                        block_y = y + tiles.min_pos.y
-                        for obj_index, obj_inst in enumerate(ifo.deco_objects):
-                            # Find which ZSC file contains this object_id
-                            target_zsc = None
-                            for deco_zsc in zsc_deco_list:
-                                if obj_inst.object_id < len(deco_zsc.objects):
-                                    target_zsc = deco_zsc
-                                    break
-                            
-                            if not target_zsc:
-                                pass
-                                continue
-                            
-                            # Use appropriate material cache key
-                            temp_cache = {}
-                            for key, mat in material_cache_deco.items():
-                                if key[0] == id(target_zsc):
-                                    temp_cache[key[1]] = mat
-                            
-                            self.spawn_object(
-                                context, deco_collection, target_zsc, obj_inst,
-                                temp_cache, mesh_cache_deco, root_3ddata,
-                                block_x=block_x, block_y=block_y,
-                                ifo_block_type="DECO", ifo_index=obj_index
-                            )
-                            total_deco += 1
+                    self.spawn_object(
+                        context, deco_objects, target_zsc, obj_inst,
+                        material_cache_deco[id(target_zsc)], mesh_cache_deco, root_3ddata,
+                        block_x=block_x, block_y=block_y,
+                        ifo_block_type="DECO", ifo_index=obj_index,
+                        location=deco_loc[k], rotation=deco_quat[k], scale=deco_scale[k]
+                    )
+                    total_deco += 1
+
+            for collection, objects in ((cnst_collection, cnst_objects),
+                                        (deco_collection, deco_objects)):
+                link = collection.objects.link
+                for obj in objects:
+                    link(obj)
+                context.scene.collection.children.link(collection)
+
+            # Deferred edge calculation of every loaded ZMS mesh
+            for zms_mesh in self._pending_update:
+                zms_mesh.update(calc_edges=True)
+            self._pending_update.clear()
             
             t = record_time("Spawn objects", t)
             
         finally:
-            pass
+            # The ZSC material templates are only copied from; remove them
+            # even if material creation or spawning failed
+            for template in self._zsc_templates.values():
+                bpy.data.materials.remove(template)
+            self._zsc_templates.clear()
         
-        # Print timing summary
+        # Print timing summary (per-stage breakdown only when verbose)
         elapsed = time.time() - start_time
+        if self.verbose_logging:
+            for stage_name, stage_elapsed in timings.items():
+                self.report({'INFO'}, f"{stage_name}: {stage_elapsed:.2f} seconds")
         self.report({'INFO'}, f"Import completed in {elapsed:.2f} seconds")
         return {"FINISHED"}
     
-    def spawn_object(self, context, collection, zsc, ifo_object, material_cache, mesh_cache, base_path,
-                     block_x=None, block_y=None, ifo_block_type=None, ifo_index=None):
-        """Spawn a ZSC object from IFO data with correct coordinate conversion"""
+    def spawn_object(self, context, new_objects, zsc, ifo_object, material_cache, mesh_cache, base_path,
+                     block_x=None, block_y=None, ifo_block_type=None, ifo_index=None,
+                     location=None, rotation=None, scale=None):
+        """Spawn a ZSC object from IFO data with correct coordinate conversion
+
+        location/rotation/scale may be passed precomputed (Blender space,
+        rotation as a WXYZ quaternion) by the batched path in execute();
+        otherwise they come from ifo_object.
+        The parent empty and its parts are appended to new_objects; the
+        caller links them into a collection.
+        """
         zsc_obj = zsc.objects[ifo_object.object_id]
         
         # Create parent empty for this object instance
@@ -1114,7 +1200,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         parent_empty = bpy.data.objects.new(obj_name, None)
         parent_empty.empty_display_type = 'PLAIN_AXES'
         parent_empty.empty_display_size = 0.5
-        collection.objects.link(parent_empty)
+        new_objects.append(parent_empty)
 
         # --- Round-trip metadata (used by the zone exporter) ---
         # Identifies which IFO file + block + object index this instance
@@ -1131,11 +1217,12 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         # --- Transform Conversion (Rose -> Blender) ---
         # Both Rose and Blender use Z-up coordinate systems
         # Convert ROSE coordinates to Blender (X, -Y, Z) and scale by 1/100
-        pos = ifo_object.position
-        bx, by, bz = convert_rose_position_to_blender(pos.x, pos.y, pos.z)
+        if location is None:
+            pos = ifo_object.position
+            location = convert_rose_position_to_blender(pos.x, pos.y, pos.z)
         # IFO positions are absolute world cm; terrain uses the same space
         # (see terrain vertex generation), so no additional offset is applied.
-        parent_empty.location = (bx, by, bz)
+        parent_empty.location = tuple(location)
 
         
         # Convert rotation from IFO (XYZW order) to Blender (WXYZ order)
@@ -1143,13 +1230,16 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         # NOTE: rotation_mode must be set BEFORE assigning
         # rotation_quaternion - in Euler mode the assignment is a no-op
         # for the actual transform in Blender 4.x.
-        from mathutils import Quaternion
-        rot = ifo_object.rotation
+        if rotation is None:
+            rot = ifo_object.rotation
+            rotation = (rot.w, rot.x, -rot.y, rot.z)
         parent_empty.rotation_mode = 'QUATERNION'
-        parent_empty.rotation_quaternion = Quaternion((rot.w, rot.x, -rot.y, rot.z))
+        parent_empty.rotation_quaternion = rotation
         
         # Scale: no axis swap needed since both use Z-up
-        parent_empty.scale = (ifo_object.scale.x, ifo_object.scale.y, ifo_object.scale.z)
+        if scale is None:
+            scale = (ifo_object.scale.x, ifo_object.scale.y, ifo_object.scale.z)
+        parent_empty.scale = tuple(scale)
         
         # Spawn all component parts (meshes) of this object
         for part_idx, part in enumerate(zsc_obj.parts):
@@ -1158,7 +1248,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
                 material_cache, mesh_cache, base_path, obj_name
             )
             if part_obj:
-                collection.objects.link(part_obj)
+                new_objects.append(part_obj)
                 part_obj.parent = parent_empty
         
         return parent_empty
@@ -1168,12 +1258,14 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         mesh_id = part.mesh_id
         material_id = part.material_id
         
-        # Retrieve or load the ZMS mesh data
-        if mesh_id not in mesh_cache:
+        # Retrieve or load the ZMS mesh data. Keyed per ZSC file: the
+        # DECO cache is shared by several ZSCs with overlapping mesh ids.
+        cache_key = (id(zsc), mesh_id)
+        if cache_key not in mesh_cache:
             mesh_path = zsc.meshes[mesh_id]
-            mesh_cache[mesh_id] = self.load_zms_mesh(mesh_path, base_path)
+            mesh_cache[cache_key] = self.load_zms_mesh(mesh_path, base_path)
         
-        mesh_data = mesh_cache[mesh_id]
+        mesh_data = mesh_cache[cache_key]
         if not mesh_data:
             return None
         
@@ -1183,10 +1275,7 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         
         # Apply material from cache
         if material_id in material_cache:
-            if len(obj.data.materials) > 0:
-                obj.data.materials[0] = material_cache[material_id]
-            else:
-                obj.data.materials.append(material_cache[material_id])
+            set_object_material(obj, material_cache[material_id])
         
         # --- Local Transform (Relative to Parent) ---
         # Both Rose and Blender use Z-up coordinate systems
@@ -1211,37 +1300,30 @@ class ImportMap(bpy.types.Operator, ImportHelper):
         return obj
     
     def load_zms_mesh(self, mesh_path, base_path):
-        """Load ZMS mesh with optimized UV assignment"""
+        """Load a ZMS mesh once per resolved file; None if unavailable"""
         full_path = self.resolve_mesh_path(mesh_path, base_path)
         if not full_path:
             return None
+        key = str(full_path)
+        if key in self._mesh_by_path:
+            return self._mesh_by_path[key]
+        self._mesh_by_path[key] = None
         
         try:
             zms = ZMS(str(full_path))
-            mesh_name = Path(mesh_path).stem
+            mesh_name = _stem(mesh_path)
             mesh = bpy.data.meshes.new(mesh_name)
             
             # Mesh vertices are in local object space - use as-is from file
             # Coordinate transform is applied via object transform, not vertex positions
-            verts = [(v.position.x, v.position.y, v.position.z) for v in zms.vertices]
-            faces = [(int(i.x), int(i.y), int(i.z)) for i in zms.indices]
-            
-            mesh.from_pydata(verts, [], faces)
+            # Edges are calculated once at the end of execute()
+            mesh_from_arrays(mesh, zms.positions_array(), zms.indices_array(), update=False)
+            self._pending_update.append(mesh)
             
             if zms.uv1_enabled() and zms.vertices:
-                uv_layer = mesh.uv_layers.new(name="UVMap")
-                # Get the UV layer data for faster access
-                uv_data = uv_layer.data
-                vertices = zms.vertices
-                
-                # Batch process UVs by polygon for better cache locality
-                for poly in mesh.polygons:
-                    for loop_idx in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                        vi = mesh.loops[loop_idx].vertex_index
-                        v = vertices[vi].uv1
-                        uv_data[loop_idx].uv = (v.x, 1.0 - v.y)
+                set_vertex_uvs(mesh, zms.uv_array(1))
             
-            mesh.update(calc_edges=True)
+            self._mesh_by_path[key] = mesh
             return mesh
         except Exception as e:
             return None
@@ -1257,57 +1339,99 @@ class ImportMap(bpy.types.Operator, ImportHelper):
             self._mesh_path_cache[cache_key] = candidate
             return candidate
         
-        # Try case-insensitive search
-        try:
-            mesh_name_lower = Path(mesh_path).name.lower()
-            for file in base_path.rglob('*'):
-                if file.is_file() and file.name.lower() == mesh_name_lower:
-                    self._mesh_path_cache[cache_key] = file
-                    return file
-        except:
-            pass
-        
-        self._mesh_path_cache[cache_key] = None
-        return None
+        # Case-insensitive lookup in the index of base_path (one walk
+        # shared by every mesh that misses the direct path)
+        found = self._file_index(base_path).get(Path(mesh_path).name.lower())
+        result = Path(found) if found else None
+        self._mesh_path_cache[cache_key] = result
+        return result
     
     def create_zsc_material(self, zsc_mat, base_path):
-        """Create material from ZSC material data"""
-        mat_name = Path(zsc_mat.path).stem
-        mat = bpy.data.materials.new(name=mat_name)
-        mat.use_nodes = True
+        """Create material from ZSC material data.
+
+        Memoized on the resolved texture path plus the alpha/two-sided
+        state, so identical materials referenced by different ZSC files
+        (or by different ids in one file) share a single datablock.
+        """
+        texture_path = None
+        if self.load_texture:
+            texture_path = self.resolve_mesh_path(zsc_mat.path, base_path)
+
+        key = (
+            str(texture_path) if texture_path else zsc_mat.path,
+            bool(zsc_mat.alpha_enabled),
+            float(zsc_mat.alpha),
+            bool(zsc_mat.two_sided),
+        )
+        mat = self._material_by_texpath.get(key)
+        if mat is not None:
+            return mat
+
+        # Node graph copied from a template; only the image, alpha and
+        # material settings differ per ZSC material
+        alpha_linked = self.load_texture and zsc_mat.alpha != 1.0
+        mat = self._zsc_material_template(alpha_linked).copy()
+        mat.name = _stem(zsc_mat.path)
+
+        if self.load_texture:
+            if texture_path:
+                mat.node_tree.nodes["Image Texture"].image = self._load_image(texture_path)
+            if zsc_mat.alpha_enabled or zsc_mat.alpha != 1.0:
+                mat.blend_method = 'BLEND'
+            if alpha_linked:
+                mat.node_tree.nodes["Principled BSDF"].inputs['Alpha'].default_value = zsc_mat.alpha
         
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
+        if zsc_mat.two_sided:
+            mat.use_backface_culling = False
+        
+        self._material_by_texpath[key] = mat
+        return mat
+
+    def _zsc_material_template(self, alpha_linked):
+        """Node graph shared by ZSC materials: texture -> BSDF -> output.
+
+        Built once per import (and per alpha wiring); texture nodes are
+        created only when textures are loaded. Removed again at the end
+        of execute().
+        """
+        template = self._zsc_templates.get(alpha_linked)
+        if template is not None:
+            return template
+
+        template = bpy.data.materials.new(name="_ROSE_ZSC_Template")
+        template.use_nodes = True
+        nodes = template.node_tree.nodes
+        links = template.node_tree.links
         nodes.clear()
         
         output = nodes.new(type='ShaderNodeOutputMaterial')
         output.location = (400, 0)
         
         bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
+        bsdf.name = "Principled BSDF"
         bsdf.location = (0, 0)
         
         if self.load_texture:
             tex_node = nodes.new(type='ShaderNodeTexImage')
+            tex_node.name = "Image Texture"
             tex_node.location = (-400, 0)
-            
-            texture_path = self.resolve_mesh_path(zsc_mat.path, base_path)
-            if texture_path:
-                try:
-                    tex_node.image = bpy.data.images.load(str(texture_path))
-                except:
-                    pass
-            
             links.new(tex_node.outputs['Color'], bsdf.inputs['Base Color'])
-            
-            if zsc_mat.alpha_enabled or zsc_mat.alpha != 1.0:
-                mat.blend_method = 'BLEND'
-                if zsc_mat.alpha != 1.0:
-                    links.new(tex_node.outputs['Alpha'], bsdf.inputs['Alpha'])
-                    bsdf.inputs['Alpha'].default_value = zsc_mat.alpha
+            if alpha_linked:
+                links.new(tex_node.outputs['Alpha'], bsdf.inputs['Alpha'])
         
         links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-        
-        if zsc_mat.two_sided:
-            mat.use_backface_culling = False
-        
-        return mat
+        self._zsc_templates[alpha_linked] = template
+        return template
+
+    def _load_image(self, image_path):
+        """Load an image once per absolute path; None if Blender cannot read it.
+
+        check_existing also reuses an image loaded by an earlier import.
+        """
+        key = os.path.abspath(image_path)
+        if key not in self._image_cache:
+            try:
+                self._image_cache[key] = bpy.data.images.load(key, check_existing=True)
+            except Exception:
+                self._image_cache[key] = None
+        return self._image_cache[key]
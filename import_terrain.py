@@ -3,17 +3,142 @@ from .rose.til import Til
 from .rose.zon import Zon
 
 from .rose.utils import (
-    Vector2, list_2d, apply_uv_rotation, patch_rotation, texture_pair,
+    QUAD_CORNER_U, QUAD_CORNER_V, apply_uv_rotation_np, zon_tile_pair,
 )
+from .mesh_utils import mesh_from_arrays
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import SimpleNamespace
 
 import bpy
+import numpy as np
 from bpy.props import StringProperty, BoolProperty, IntProperty
 from bpy_extras.io_utils import ImportHelper
 
+# Path resolution caches shared by all ImportTerrain runs, so importing
+# several tiles of one client back to back doesn't repeat the directory
+# walks. Directory-derived entries carry the mtime of every directory they
+# were read from and are only reused while those mtimes are unchanged, so
+# files added, removed or renamed since are picked up. Misses are cached
+# too (as None). ImportTerrain._clear_caches() empties them.
+# ZON directory -> 3DDATA root (computed from the path alone)
+_3DDATA_ROOT_CACHE = {}
+# (3DDATA root, ZON texture path) -> (resolved file path, ((directory, mtime), ...))
+_TEXTURE_PATH_CACHE = {}
+# Directory -> (mtime, {lower-case file name: path}, [subdirectory paths])
+_DIR_SCAN_CACHE = {}
+
+
+def _dir_mtime(directory):
+    """Modification time of a directory in ns (None if it is missing)"""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scan_dir(directory, stamps=None):
+    """Files (by lower-case name) and subdirectories of `directory`.
+
+    Each directory is read once with os.scandir() and the listing is
+    cached until the directory's mtime changes, so texture lookups are
+    dict probes instead of per-candidate stat calls. A missing directory
+    yields empty results. If given, `stamps` collects (directory, mtime)
+    of every directory consulted.
+    """
+    directory = str(directory)
+    mtime = _dir_mtime(directory)
+    if stamps is not None:
+        stamps.append((directory, mtime))
+    listing = _DIR_SCAN_CACHE.get(directory)
+    if listing is None or listing[0] != mtime:
+        files = {}
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        files.setdefault(entry.name.lower(), entry.path)
+                    elif entry.is_dir():
+                        subdirs.append(entry.path)
+        except OSError:
+            pass
+        listing = _DIR_SCAN_CACHE[directory] = (mtime, files, subdirs)
+    return listing[1], listing[2]
+
+
+def _find_texture(root_3ddata, texture_path):
+    """Resolve a ZON texture path below root_3ddata (None if not found).
+
+    Results, misses included, are cached in _TEXTURE_PATH_CACHE together
+    with the mtimes of the directories the lookup read, and reused while
+    none of them changed. Touches no bpy state, so it can run on worker
+    threads.
+    """
+    cache_key = (root_3ddata, texture_path)
+    cached = _TEXTURE_PATH_CACHE.get(cache_key)
+    if cached is not None and all(_dir_mtime(d) == m for d, m in cached[1]):
+        return cached[0]
+
+    # Normalize path separators
+    texture_relative = texture_path.replace('\\', os.sep)
+    texture_name_lower = Path(texture_relative).name.lower()
+    stamps = []
+
+    def found(result):
+        _TEXTURE_PATH_CACHE[cache_key] = (result, tuple(stamps))
+        return result
+
+    # Try the exact path first, then relative to the parent of 3DDATA.
+    # Every probe is a lookup in the directory's (cached) listing
+    # instead of a stat call.
+    for base in (root_3ddata, root_3ddata.parent):
+        result = _scan_dir((base / texture_relative).parent, stamps)[0].get(texture_name_lower)
+        if result:
+            return found(result)
+
+    # Try common texture directories with direct path construction
+    common_dirs = [
+        root_3ddata / "MAPS",
+        root_3ddata / "MAPS" / "JUNON",
+        root_3ddata / "MAPS" / "ELDEON",
+        root_3ddata / "MAPS" / "LUNAR",
+    ]
+
+    # Try to extract planet name from texture path
+    path_parts = texture_relative.upper().split(os.sep)
+    if "JUNON" in path_parts:
+        common_dirs.append(root_3ddata / "MAPS" / "JUNON")
+    if "ELDEON" in path_parts:
+        common_dirs.append(root_3ddata / "MAPS" / "ELDEON")
+    if "LUNAR" in path_parts:
+        common_dirs.append(root_3ddata / "MAPS" / "LUNAR")
+
+    for base_dir in common_dirs:
+        result = _scan_dir(base_dir, stamps)[0].get(texture_name_lower)
+        if result:
+            return found(result)
+
+    # Last resort: one level of subdirectories below the common
+    # directories (or 3DDATA itself if none of them exist)
+    search_dirs = [d for d in common_dirs if d.is_dir()]
+    if not search_dirs:
+        search_dirs = [root_3ddata]
+
+    for search_dir in search_dirs:
+        files, subdirs = _scan_dir(search_dir, stamps)
+        result = files.get(texture_name_lower)
+        if result:
+            return found(result)
+        for subdir in subdirs:
+            result = _scan_dir(subdir, stamps)[0].get(texture_name_lower)
+            if result:
+                return found(result)
+
+    return found(None)
+
 
 class ImportTerrain(bpy.types.Operator, ImportHelper):
     """Import ROSE terrain only (no decorations or objects)"""
@@ -58,114 +183,32 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
 
     texture_extensions = [".DDS", ".dds", ".PNG", ".png"]
 
-    def __init__(self, *args, **kwargs):
-        """Initialize with caches for path resolution"""
-        super().__init__(*args, **kwargs)
-        self._texture_path_cache = {}
-        self._3ddata_root_cache = None
+    @staticmethod
+    def _clear_caches():
+        """Drop the shared path resolution caches (e.g. between test runs)"""
+        _3DDATA_ROOT_CACHE.clear()
+        _TEXTURE_PATH_CACHE.clear()
+        _DIR_SCAN_CACHE.clear()
 
     def _get_3ddata_root(self, zon_filepath):
-        """Get 3DDATA root directory with caching."""
-        if self._3ddata_root_cache is not None:
-            return self._3ddata_root_cache
-            
-        zon_path = Path(zon_filepath).resolve()
-        current = zon_path.parent
-        max_depth = 10
-        depth = 0
-
-        while depth < max_depth:
-            if current.name.upper() == "3DDATA":
-                self._3ddata_root_cache = current
-                return current
-            current = current.parent
-            depth += 1
-        
-        return None
-
-    def resolve_texture_path(self, zon_filepath, texture_path):
-        """Resolve texture path from ZON to actual file path with caching."""
-        # Check cache first
-        cache_key = (zon_filepath, texture_path)
-        if cache_key in self._texture_path_cache:
-            return self._texture_path_cache[cache_key]
-        
-        zon_path = Path(zon_filepath).resolve()
-        root_3ddata = self._get_3ddata_root(zon_filepath)
+        """Get 3DDATA root directory with caching (per ZON directory).
 
-        if not root_3ddata:
-            self._texture_path_cache[cache_key] = None
-            return None
+        The nearest ancestor named 3DDATA (any case), found with one pass
+        over the path components.
+        """
+        zon_dir = os.path.dirname(os.path.abspath(zon_filepath))
+        if zon_dir in _3DDATA_ROOT_CACHE:
+            return _3DDATA_ROOT_CACHE[zon_dir]
 
-        # Normalize path separators
-        texture_relative = texture_path.replace('\\', os.sep)
-        texture_name = Path(texture_relative).name
-
-        # Try exact path first (fastest)
-        full_path = root_3ddata / texture_relative
-        if full_path.exists():
-            result = str(full_path)
-            self._texture_path_cache[cache_key] = result
-            return result
-
-        # Try parent of 3DDATA
-        full_path = root_3ddata.parent / texture_relative
-        if full_path.exists():
-            result = str(full_path)
-            self._texture_path_cache[cache_key] = result
-            return result
-
-        # Try common texture directories with direct path construction
-        common_dirs = [
-            root_3ddata / "MAPS",
-            root_3ddata / "MAPS" / "JUNON",
-            root_3ddata / "MAPS" / "ELDEON",
-            root_3ddata / "MAPS" / "LUNAR",
-        ]
-        
-        # Try to extract planet name from texture path
-        path_parts = texture_relative.upper().split(os.sep)
-        if "JUNON" in path_parts:
-            common_dirs.append(root_3ddata / "MAPS" / "JUNON")
-        if "ELDEON" in path_parts:
-            common_dirs.append(root_3ddata / "MAPS" / "ELDEON")
-        if "LUNAR" in path_parts:
-            common_dirs.append(root_3ddata / "MAPS" / "LUNAR")
-        
-        # Direct file existence check in common directories
-        for base_dir in common_dirs:
-            if base_dir.exists():
-                candidate = base_dir / texture_name
-                if candidate.exists():
-                    result = str(candidate)
-                    self._texture_path_cache[cache_key] = result
-                    return result
-
-        # Last resort: case-insensitive search with limited scope
-        search_dirs = [d for d in common_dirs if d.exists()]
-        if not search_dirs:
-            search_dirs = [root_3ddata]
-        
-        texture_name_lower = texture_name.lower()
-        for search_dir in search_dirs:
-            try:
-                for item in search_dir.iterdir():
-                    if item.is_file() and item.name.lower() == texture_name_lower:
-                        result = str(item)
-                        self._texture_path_cache[cache_key] = result
-                        return result
-                    if item.is_dir():
-                        for subitem in item.iterdir():
-                            if subitem.is_file() and subitem.name.lower() == texture_name_lower:
-                                result = str(subitem)
-                                self._texture_path_cache[cache_key] = result
-                                return result
-            except Exception:
-                continue
+        parts = Path(zon_filepath).resolve().parent.parts
+        upper = [part.upper() for part in parts]
+        root = None
+        if "3DDATA" in upper:
+            idx = len(upper) - 1 - upper[::-1].index("3DDATA")
+            root = Path(*parts[:idx + 1])
 
-        self.report({'WARNING'}, f"Texture not found: {texture_relative}")
-        self._texture_path_cache[cache_key] = None
-        return None
+        _3DDATA_ROOT_CACHE[zon_dir] = root
+        return root
 
     def create_terrain_materials(self, zon_path, texture_paths, texture_pairs):
         """
@@ -178,50 +221,106 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
 
         Returns:
             (materials, pair_to_slot): list of materials and a dict mapping
-            (layer1, layer2) pairs to material slots.
+            (layer1, layer2) pairs to material slots. Pairs whose textures
+            could not be loaded get the shared ROSE_Missing material, so
+            every pair has a slot and slot == position in sorted order.
         """
+        pairs = sorted(texture_pairs)
+        images = self.load_terrain_images(
+            zon_path, texture_paths, {idx for pair in pairs for idx in pair})
+
         materials = []
-        pair_to_slot = {}
-        for pair in sorted(texture_pairs):
-            mat = self.create_terrain_material(zon_path, texture_paths, pair[0], pair[1])
-            if mat is not None:
-                pair_to_slot[pair] = len(materials)
-                materials.append(mat)
+        for pair in pairs:
+            mat = self.create_terrain_material(images, pair[0], pair[1])
+            materials.append(mat if mat is not None else self.get_missing_material())
+        pair_to_slot = {pair: slot for slot, pair in enumerate(pairs)}
         return materials, pair_to_slot
 
-    def create_terrain_material(self, zon_path, texture_paths, l1, l2):
+    def get_missing_material(self):
+        """Shared magenta placeholder for texture pairs that failed to load."""
+        mat = bpy.data.materials.get("ROSE_Missing")
+        if mat is None:
+            mat = bpy.data.materials.new(name="ROSE_Missing")
+            mat.diffuse_color = (1.0, 0.0, 1.0, 1.0)
+            mat.use_nodes = True
+            bsdf = mat.node_tree.nodes.get("Principled BSDF")
+            if bsdf is not None:
+                bsdf.inputs['Base Color'].default_value = (1.0, 0.0, 1.0, 1.0)
+        return mat
+
+    def load_terrain_images(self, zon_path, texture_paths, texture_indices):
+        """Load the images of the given ZON texture indices.
+
+        Each texture is resolved and its file read once on a thread pool,
+        so directory scans and reads overlap across textures and
+        bpy.data.images.load() (which has to run on the main thread)
+        reads them from the OS page cache. Misses are reported from the
+        main thread.
+
+        Returns:
+            dict mapping texture index -> image (None if unavailable)
+        """
+        root_3ddata = self._get_3ddata_root(zon_path)
+        wanted = sorted(idx for idx in texture_indices if idx < len(texture_paths))
+
+        def resolve_and_prefetch(idx):
+            path = _find_texture(root_3ddata, texture_paths[idx])
+            if path is not None:
+                try:
+                    with open(path, 'rb') as f:
+                        while f.read(1 << 20):
+                            pass
+                except OSError:
+                    path = None
+            return idx, path
+
+        resolved = {}
+        if root_3ddata:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+                for idx, path in pool.map(resolve_and_prefetch, wanted):
+                    if path is None:
+                        texture_relative = texture_paths[idx].replace('\\', os.sep)
+                        self.report({'WARNING'}, f"Texture not found: {texture_relative}")
+                    else:
+                        resolved[idx] = path
+
+        images = {}
+        for idx in texture_indices:
+            images[idx] = None
+            if idx not in resolved:
+                continue
+            try:
+                image = bpy.data.images.load(resolved[idx], check_existing=True)
+                # Terrain tiles are sRGB-encoded but must be sampled raw:
+                # Blender's sRGB mipmap pipeline darkens minified samples to
+                # black (double sRGB->linear conversion on mip levels).
+                # Load as Non-Color and linearize manually with Gamma nodes.
+                image.colorspace_settings.name = "Non-Color"
+                images[idx] = image
+            except Exception:
+                pass
+        return images
+
+    def create_terrain_material(self, images, l1, l2):
         """Create a two-layer terrain material.
 
         Replicates the game shader (terrain_material.wgsl):
             final = mix(layer1, layer2, layer2.alpha)
         Layer1 samples the plain patch-local UV map; layer2 samples the
-        rotation-adjusted UV map (UVMap_rot).
+        rotation-adjusted UV map (UVMap_rot). `images` maps texture
+        indices to loaded images (see load_terrain_images).
         """
+        image1 = images.get(l1)
+        image2 = images.get(l2) if l2 != l1 else None
+        if image1 is None and image2 is None:
+            return None
+
         mat = bpy.data.materials.new(name=f"ROSE_Terrain_{l1}_{l2}")
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
         links = mat.node_tree.links
         nodes.clear()
 
-        def load_image(idx):
-            if idx >= len(texture_paths):
-                return None
-            resolved = self.resolve_texture_path(zon_path, texture_paths[idx])
-            if not resolved or not Path(resolved).exists():
-                return None
-            try:
-                image = bpy.data.images.get(Path(resolved).name)
-                if not image:
-                    image = bpy.data.images.load(resolved)
-                # Terrain tiles are sRGB-encoded but must be sampled raw:
-                # Blender's sRGB mipmap pipeline darkens minified samples to
-                # black (double sRGB->linear conversion on mip levels).
-                # Load as Non-Color and linearize manually with Gamma nodes.
-                image.colorspace_settings.name = "Non-Color"
-                return image
-            except Exception:
-                return None
-
         def connect_color(tex_node, target_socket):
             """tex Color -> Gamma(2.2) -> target (manual sRGB linearization)."""
             gamma = nodes.new(type='ShaderNodeGamma')
@@ -230,12 +329,6 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
             links.new(tex_node.outputs['Color'], gamma.inputs['Color'])
             links.new(gamma.outputs['Color'], target_socket)
 
-        image1 = load_image(l1)
-        image2 = load_image(l2) if l2 != l1 else None
-        if image1 is None and image2 is None:
-            bpy.data.materials.remove(mat)
-            return None
-
         output = nodes.new(type='ShaderNodeOutputMaterial')
         output.location = (600, 0)
         bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
@@ -305,24 +398,10 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
         wm.progress_begin(0, 100)
 
         try:
-            filepath = Path(self.filepath).resolve()
-            
             # Find 3DDATA root
-            root_3ddata = filepath
-            while root_3ddata.name.upper() != "3DDATA" and root_3ddata.parent != root_3ddata:
-                root_3ddata = root_3ddata.parent
-            
-            if root_3ddata.name.upper() != "3DDATA":
+            if self._get_3ddata_root(self.filepath) is None:
                 return {'CANCELLED'}
 
-            him_ext = ".HIM"
-            til_ext = ".TIL"
-
-            # Handle case-sensitive platforms
-            if self.filepath.endswith(".zon"):
-                him_ext = ".him"
-                til_ext = ".til"
-
             zon = Zon(self.filepath)
             zon_dir = os.path.dirname(self.filepath)
 
@@ -331,59 +410,98 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
             grid_scale = zon.grid_size / 100.0
 
             tiles = SimpleNamespace()
-            tiles.min_pos = Vector2(999, 999)
-            tiles.max_pos = Vector2(-1, -1)
-            tiles.dimension = Vector2(0, 0)
-            tiles.count = 0
+            # Tile coordinate bounds, kept as plain locals
+            min_x = min_y = 10 ** 9
+            max_x = max_y = -1
             tiles.coords = []
-
-            # Scan directory for HIM files
-            for file in os.listdir(zon_dir):
-                if file.endswith(him_ext):
-                    try:
-                        x, y = map(int, file.split(".")[0].split("_"))
-                        
-                        if self.limit_tiles and (x != self.tile_x or y != self.tile_y):
+            # (x, y) -> HIM / TIL path as found on disk (the extension case
+            # may differ from the .zon file's)
+            him_files = {}
+            til_files = {}
+
+            if self.limit_tiles:
+                # Single tile: probe its HIM and TIL files directly instead
+                # of listing the whole zone directory
+                x, y = self.tile_x, self.tile_y
+                for files, exts in ((him_files, (".HIM", ".him")), (til_files, (".TIL", ".til"))):
+                    for ext in exts:
+                        path = os.path.join(zon_dir, "{}_{}{}".format(x, y, ext))
+                        if os.path.isfile(path):
+                            files[x, y] = path
+                            break
+                if (x, y) in him_files:
+                    min_x = max_x = x
+                    min_y = max_y = y
+                    tiles.coords.append((x, y))
+            else:
+                # Scan directory for HIM and TIL files (scandir streams the
+                # entries with their type, so no per-name stat is needed).
+                # Extensions are matched case-insensitively once per entry.
+                with os.scandir(zon_dir) as it:
+                    for entry in it:
+                        name = entry.name
+                        lower = name.lower()
+                        is_til = lower.endswith(".til")
+                        if not (is_til or lower.endswith(".him")) or not entry.is_file():
                             continue
-                        
-                        tiles.min_pos.x = min(x, tiles.min_pos.x)
-                        tiles.min_pos.y = min(y, tiles.min_pos.y)
-                        tiles.max_pos.x = max(x, tiles.max_pos.x)
-                        tiles.max_pos.y = max(y, tiles.max_pos.y)
-                        tiles.count += 1
+                        try:
+                            x, y = map(int, name.split(".")[0].split("_"))
+                        except ValueError:
+                            continue
+                        if is_til:
+                            til_files[x, y] = entry.path
+                            continue
+
+                        if x < min_x:
+                            min_x = x
+                        if x > max_x:
+                            max_x = x
+                        if y < min_y:
+                            min_y = y
+                        if y > max_y:
+                            max_y = y
                         tiles.coords.append((x, y))
-                    except:
-                        continue
+                        him_files[x, y] = entry.path
 
-            if tiles.count == 0:
+            if not tiles.coords:
                 return {'CANCELLED'}
 
-            tiles.dimension.x = tiles.max_pos.x - tiles.min_pos.x + 1
-            tiles.dimension.y = tiles.max_pos.y - tiles.min_pos.y + 1
-
-            tiles.indices = list_2d(tiles.dimension.y, tiles.dimension.x)
-            tiles.hims = list_2d(tiles.dimension.y, tiles.dimension.x)
-            tiles.tils = list_2d(tiles.dimension.y, tiles.dimension.x)
-
-            # Load Him/Til files
-            for x, y in tiles.coords:
-                tile_name = "{}_{}".format(x, y)
-                him_file = os.path.join(zon_dir, tile_name + him_ext)
-                til_file = os.path.join(zon_dir, tile_name + til_ext)
-
-                norm_x = x - tiles.min_pos.x
-                norm_y = y - tiles.min_pos.y
-
+            dim_x = max_x - min_x + 1
+            dim_y = max_y - min_y + 1
+
+            # Per-tile grids are flat lists indexed y * stride + x
+            stride = dim_x
+            tile_count = dim_y * stride
+            # Global vertex index grid of each tile ((length, width) int32)
+            tiles.indices = [None] * tile_count
+            tiles.hims = [None] * tile_count
+            tiles.tils = [None] * tile_count
+
+            missing_til = sum(1 for coord in tiles.coords if coord not in til_files)
+            if missing_til:
+                self.report({'WARNING'}, f"{missing_til} tile(s) have no TIL file and are skipped")
+
+            # Load Him/Til files. Tiles are independent, so they are parsed
+            # on a thread pool (overlapping the file reads); the results are
+            # placed on the main thread and the worker never touches bpy.
+            def load_tile(coord):
+                x, y = coord
+                if coord not in til_files:
+                    return x, y, None, None
                 try:
-                    him = Him(him_file)
-                    til = Til(til_file)
-                    him.indices = list_2d(him.width, him.length)
+                    return x, y, Him(him_files[x, y]), Til(til_files[x, y])
+                except Exception:
+                    return x, y, None, None
+
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+                loaded = list(pool.map(load_tile, tiles.coords))
 
-                    tiles.indices[norm_y][norm_x] = list_2d(him.width, him.length)
-                    tiles.hims[norm_y][norm_x] = him
-                    tiles.tils[norm_y][norm_x] = til
-                except Exception as e:
-                    pass
+            for x, y, him, til in loaded:
+                if him is None:
+                    continue
+                i = (y - min_y) * stride + (x - min_x)
+                tiles.hims[i] = him
+                tiles.tils[i] = til
 
             wm.progress_update(30)
 
@@ -393,145 +511,203 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
             #   heightmap samples every grid_scale meters.
             block_size = 64.0 * grid_scale
             world_origin = -32.5 * block_size
-            vertices = []
-            edges = []
-            faces = []
-            # Per-face patch-local UVs: ((u,v) x4 corners, layer2 rotation)
-            face_uvs = []
-
-            for y in range(tiles.dimension.y):
-                for x in range(tiles.dimension.x):
-                    if not tiles.hims[y][x]:
+            # The vertex count is known once the tiles are loaded, so the
+            # coordinates go into one float32 buffer filled per tile
+            vertices = np.empty((sum(him.width * him.length for him in tiles.hims if him), 3),
+                                dtype=np.float32)
+            n_verts = 0
+            # Quads are collected as (n, 4) vertex index chunks: every
+            # tile's main quads, then the stitch quads
+            face_chunks = []
+            n_faces = 0
+            # First face index of each tile's main quads / stitch quads
+            # (-1 = no tile). All main quads are emitted before any stitch
+            # quad, so the per-face passes index by these bases rather than
+            # by walking the tiles in order.
+            tiles.face_base = [-1] * tile_count
+            tiles.stitch_base = [-1] * tile_count
+            # Patch -> ZON tile index grid of each tile's TIL, out-of-range
+            # indices clamped to len(zon.tiles) (None = no TIL)
+            tiles.patch_tiles = [None] * tile_count
+            # Layer2 rotation of every TIL patch of each tile
+            tile_rotations = [None] * tile_count
+            # Per-face patch-local corner UVs and layer2 rotation, in the
+            # same order as the face chunks
+            uv_chunks = []
+            rotation_chunks = []
+
+            # ZON tile index -> layer2 rotation (trailing entry: 1 = None,
+            # as in patch_rotation for out-of-range tile indices)
+            rotation_lut = np.array([t.rotation for t in zon.tiles] + [1], dtype=np.int32)
+
+            # Zone tiles are almost all the same size, so the arrays that
+            # depend only on a tile's position or shape are built once and
+            # reused: world coordinates of the samples along one axis
+            # (keyed by block coordinate and sample count) and the quad
+            # corner offsets, patch UVs and quad -> patch maps (keyed by
+            # the (length, width) shape)
+            axis_coords = {}
+            shape_templates = {}
+
+            def axis_lut(block, n):
+                key = (block, n)
+                coords = axis_coords.get(key)
+                if coords is None:
+                    coords = block * block_size + world_origin + np.arange(n) * grid_scale
+                    axis_coords[key] = coords
+                return coords
+
+            def shape_template(h, w):
+                template = shape_templates.get((h, w))
+                if template is None:
+                    # Quad corners (v1, v2, v3, v4) relative to the tile's
+                    # first vertex, for every cell
+                    q = np.arange(h * w).reshape(h, w)[:-1, :-1]
+                    quads = np.stack((q, q + 1, q + 1 + w, q + w), axis=-1).reshape(-1, 4)
+                    # Patch-local UVs (matching the client's uv1 = [x/4, y/4]):
+                    # each quad covers a quarter of its patch
+                    uvs = np.empty((h - 1, w - 1, 4, 2))
+                    uvs[..., 0] = (np.arange(w - 1) % 4 / 4.0)[None, :, None] + QUAD_CORNER_U
+                    uvs[..., 1] = (np.arange(h - 1) % 4 / 4.0)[:, None, None] + QUAD_CORNER_V
+                    template = (quads, uvs.reshape(-1, 4, 2).astype(np.float32),
+                                np.arange(w - 1) // 4, np.arange(h - 1) // 4)
+                    shape_templates[h, w] = template
+                return template
+
+            for y in range(dim_y):
+                for x in range(dim_x):
+                    i = y * stride + x
+                    if not tiles.hims[i]:
                         continue
                         
-                    indices = tiles.indices[y][x]
-                    him = tiles.hims[y][x]
-                    til = tiles.tils[y][x]
-                    base_x = (x + tiles.min_pos.x) * block_size + world_origin
-                    base_y = (y + tiles.min_pos.y) * block_size + world_origin
-
-                    for vy in range(him.length):
-                        for vx in range(him.width):
-                            height = him.heights[vy][vx] / 100.0
-                            
-                            world_x = base_x + vx * grid_scale
-                            world_y = base_y + vy * grid_scale
-                            
-                            vertices.append((world_x, world_y, height))
-                            vi = len(vertices) - 1
-                            him.indices[vy][vx] = vi
-                            indices[vy][vx] = vi
-
-                            if vx < him.width - 1 and vy < him.length - 1:
-                                v1 = vi
-                                v2 = vi + 1
-                                v3 = vi + 1 + him.width
-                                v4 = vi + him.width
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                # Patch-local UVs (matching the client's uv1 = [x/4, y/4])
-                                px, py = vx // 4, vy // 4
-                                u0 = (vx - px * 4) / 4.0
-                                v0 = (vy - py * 4) / 4.0
-                                face_uvs.append((
-                                    ((u0, v0),
-                                     (u0 + 0.25, v0),
-                                     (u0 + 0.25, v0 + 0.25),
-                                     (u0, v0 + 0.25)),
-                                    patch_rotation(til, zon, px, py),
-                                ))
-
-            # Generate inter-tile connections
-            for y in range(tiles.dimension.y):
-                for x in range(tiles.dimension.x):
-                    if not tiles.hims[y][x] or not tiles.indices[y][x]:
+                    him = tiles.hims[i]
+                    til = tiles.tils[i]
+                    h, w = him.length, him.width
+                    quads, uvs, quad_px, quad_py = shape_template(h, w)
+
+                    # Whole-tile vertex grid, row-major (vy, vx)
+                    base = n_verts
+                    tile_verts = vertices[base:base + h * w].reshape(h, w, 3)
+                    tile_verts[:, :, 0] = axis_lut(x + min_x, w)
+                    tile_verts[:, :, 1] = axis_lut(y + min_y, h)[:, None]
+                    # HIM heights are float32 cm; scaled to meters in
+                    # float32 straight into the vertex buffer (no float64
+                    # temporary)
+                    np.divide(np.asarray(him.heights, dtype=np.float32), np.float32(100.0),
+                              out=tile_verts[:, :, 2])
+                    n_verts += h * w
+
+                    # Global vertex index of every grid sample
+                    him.indices = base + np.arange(h * w, dtype=np.int32).reshape(h, w)
+                    tiles.indices[i] = him.indices
+                    tiles.face_base[i] = n_faces
+                    face_chunks.append(quads + base)
+                    n_faces += len(quads)
+
+                    # Quad column/row -> (clamped) patch rotation
+                    if til and til.tiles:
+                        tiles.patch_tiles[i] = np.minimum(til.tile_indices_np(), len(zon.tiles))
+                        rotations = rotation_lut[tiles.patch_tiles[i]]
+                    else:
+                        rotations = np.ones((1, 1), dtype=np.int32)
+                    tile_rotations[i] = rotations
+                    cx = np.minimum(quad_px, rotations.shape[1] - 1)
+                    cy = np.minimum(quad_py, rotations.shape[0] - 1)
+                    uv_chunks.append(uvs)
+                    rotation_chunks.append(rotations[np.ix_(cy, cx)].ravel())
+
+            # Generate inter-tile connections. Each seam is a whole column
+            # or row of quads, built from slices of the index grids.
+            for y in range(dim_y):
+                for x in range(dim_x):
+                    i = y * stride + x
+                    indices = tiles.indices[i]
+                    if indices is None:
                         continue
-                        
-                    indices = tiles.indices[y][x]
-                    him = tiles.hims[y][x]
-                    is_x_edge = (x == tiles.dimension.x - 1)
-                    is_y_edge = (y == tiles.dimension.y - 1)
+
+                    tiles.stitch_base[i] = n_faces
+                    h, w = indices.shape
+                    # This tile's own patch rotations (the stitch quads take
+                    # their rotation from the tile they belong to)
+                    rotations = tile_rotations[i]
 
                     # Skip connections to neighboring tiles that don't exist on disk
                     # (zones are sparse grids; missing tiles are skipped like the Rust client)
-                    has_x_neighbor = not is_x_edge and bool(tiles.indices[y][x + 1])
-                    has_y_neighbor = not is_y_edge and bool(tiles.indices[y + 1][x])
-                    has_xy_neighbor = has_x_neighbor and has_y_neighbor and bool(tiles.indices[y + 1][x + 1])
-
-                    for vy in range(him.length):
-                        for vx in range(him.width):
-                            is_x_edge_vertex = (vx == him.width - 1) and (vy < him.length - 1)
-                            is_y_edge_vertex = (vx < him.width - 1) and (vy == him.length - 1)
-                            is_corner_vertex = (vx == him.width - 1) and (vy == him.length - 1)
-
-                            if has_x_neighbor and is_x_edge_vertex:
-                                next_indices = tiles.indices[y][x + 1]
-                                v1 = indices[vy][vx]
-                                v2 = next_indices[vy][0]
-                                v3 = next_indices[vy + 1][0]
-                                v4 = indices[vy + 1][vx]
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                # Edge stitch quad is degenerate in world space;
-                                # give it the edge patch's UVs
-                                px, py = min(vx // 4, 15), vy // 4
-                                va = (vy - py * 4) / 4.0
-                                vb = (vy + 1 - py * 4) / 4.0
-                                face_uvs.append((
-                                    ((1.0, va), (0.0, va), (0.0, vb), (1.0, vb)),
-                                    patch_rotation(til, zon, px, py),
-                                ))
-
-                            if has_y_neighbor and is_y_edge_vertex:
-                                next_indices = tiles.indices[y + 1][x]
-                                v1 = indices[vy][vx]
-                                v2 = indices[vy][vx + 1]
-                                v3 = next_indices[0][vx + 1]
-                                v4 = next_indices[0][vx]
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                px, py = vx // 4, min(vy // 4, 15)
-                                ua = (vx - px * 4) / 4.0
-                                ub = (vx + 1 - px * 4) / 4.0
-                                face_uvs.append((
-                                    ((ua, 1.0), (ub, 1.0), (ub, 0.0), (ua, 0.0)),
-                                    patch_rotation(til, zon, px, py),
-                                ))
-
-                            if has_xy_neighbor and is_corner_vertex:
-                                right = tiles.indices[y][x + 1]
-                                diag = tiles.indices[y + 1][x + 1]
-                                down = tiles.indices[y + 1][x]
-                                diag_him = tiles.hims[y + 1][x + 1]
-                                down_him = tiles.hims[y + 1][x]
-
-                                v1 = indices[vy][vx]
-                                v2 = right[diag_him.length - 1][0]
-                                v3 = diag[0][0]
-                                v4 = down[0][down_him.width - 1]
-                                edges += ((v1, v2), (v2, v3), (v3, v4), (v4, v1))
-                                faces.append((v1, v2, v3, v4))
-                                face_uvs.append((
-                                    ((1.0, 1.0), (1.0, 1.0), (1.0, 1.0), (1.0, 1.0)),
-                                    patch_rotation(til, zon, 15, 15),
-                                ))
+                    has_x_neighbor = x < dim_x - 1 and tiles.indices[i + 1] is not None
+                    has_y_neighbor = y < dim_y - 1 and tiles.indices[i + stride] is not None
+                    has_xy_neighbor = has_x_neighbor and has_y_neighbor and tiles.indices[i + stride + 1] is not None
+
+                    # Patch row/column of the stitch edges (patch_rotation
+                    # clamping: first to 15, then to the TIL size)
+                    edge_px = min((w - 1) // 4, 15, rotations.shape[1] - 1)
+                    edge_py = min((h - 1) // 4, 15, rotations.shape[0] - 1)
+                    # Stitch quads are emitted X edge, then Y edge, then
+                    # corner; the material pass relies on this order.
+                    stitch_chunks = []
+
+                    if has_x_neighbor:
+                        # Right column of this tile -> left column of the next
+                        next_indices = tiles.indices[i + 1]
+                        stitch_chunks.append(np.stack(
+                            (indices[:h - 1, w - 1], next_indices[:h - 1, 0],
+                             next_indices[1:h, 0], indices[1:h, w - 1]), axis=-1))
+                        # Edge stitch quad is degenerate in world space;
+                        # give it the edge patch's UVs
+                        uvs = np.empty((h - 1, 4, 2), dtype=np.float32)
+                        uvs[:, :, 0] = (1.0, 0.0, 0.0, 1.0)
+                        uvs[:, :, 1] = (np.arange(h - 1) % 4 / 4.0)[:, None] + QUAD_CORNER_V
+                        uv_chunks.append(uvs)
+                        cy = np.minimum(np.arange(h - 1) // 4, rotations.shape[0] - 1)
+                        rotation_chunks.append(rotations[cy, edge_px])
+
+                    if has_y_neighbor:
+                        # Bottom row of this tile -> top row of the next
+                        next_indices = tiles.indices[i + stride]
+                        stitch_chunks.append(np.stack(
+                            (indices[h - 1, :w - 1], indices[h - 1, 1:w],
+                             next_indices[0, 1:w], next_indices[0, :w - 1]), axis=-1))
+                        uvs = np.empty((w - 1, 4, 2), dtype=np.float32)
+                        uvs[:, :, 0] = (np.arange(w - 1) % 4 / 4.0)[:, None] + QUAD_CORNER_U
+                        uvs[:, :, 1] = (1.0, 1.0, 0.0, 0.0)
+                        uv_chunks.append(uvs)
+                        cx = np.minimum(np.arange(w - 1) // 4, rotations.shape[1] - 1)
+                        rotation_chunks.append(rotations[edge_py, cx])
+
+                    if has_xy_neighbor:
+                        right = tiles.indices[i + 1]
+                        diag = tiles.indices[i + stride + 1]
+                        down = tiles.indices[i + stride]
+                        stitch_chunks.append(np.array([[
+                            indices[h - 1, w - 1],
+                            right[diag.shape[0] - 1, 0],
+                            diag[0, 0],
+                            down[0, down.shape[1] - 1],
+                        ]], dtype=np.int32))
+                        uv_chunks.append(np.ones((1, 4, 2), dtype=np.float32))
+                        rotation_chunks.append(rotations[min(15, rotations.shape[0] - 1),
+                                                         min(15, rotations.shape[1] - 1)].reshape(1))
+
+                    for chunk in stitch_chunks:
+                        face_chunks.append(chunk)
+                        n_faces += len(chunk)
 
             # Create terrain mesh
             mesh = bpy.data.meshes.new("ROSE_Terrain")
-            mesh.from_pydata(vertices, edges, faces)
-            mesh.update()
+            # Filled straight from the arrays (no from_pydata() conversion);
+            # edges are calculated by the mesh.update() after the material pass
+            mesh_from_arrays(mesh, vertices, np.concatenate(face_chunks), update=False)
 
             # UV maps matching the game: uv1 = patch-local 0..1 per TIL patch,
             # UVMap_rot = same coords with the patch's layer2 rotation applied.
+            # Every face is a quad, so face i owns loops 4*i .. 4*i+3 and
+            # the per-corner arrays are written in one call each.
+            face_uv = np.concatenate(uv_chunks)
+            face_rotations = np.concatenate(rotation_chunks)
             uv_layer = mesh.uv_layers.new(name="UVMap")
             uv2_layer = mesh.uv_layers.new(name="UVMap_rot")
-            for fi, (corners, rotation) in enumerate(face_uvs):
-                poly = mesh.polygons[fi]
-                for li in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                    corner = li - poly.loop_start
-                    u, v = corners[corner]
-                    uv_layer.data[li].uv = (u, v)
-                    uv2_layer.data[li].uv = apply_uv_rotation(u, v, rotation)
+            uv_layer.data.foreach_set("uv", face_uv.ravel())
+            uv2_layer.data.foreach_set(
+                "uv", apply_uv_rotation_np(face_uv, face_rotations[:, None]).ravel())
 
             wm.progress_update(50)
             
@@ -541,23 +717,11 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
                 # Collect the distinct (layer1, layer2) texture pairs used by
                 # the map's TIL patches (matching the Rust client's two-layer
                 # blending; see terrain.rs and terrain_material.wgsl).
-                texture_pairs = set()
-                for ty in range(int(tiles.dimension.y)):
-                    for tx in range(int(tiles.dimension.x)):
-                        til = tiles.tils[ty][tx]
-                        if not til or not til.tiles:
-                            continue
-                        for row in til.tiles:
-                            for patch in row:
-                                if patch.tile < len(zon.tiles):
-                                    ztile = zon.tiles[patch.tile]
-                                    l1 = ztile.layer1 + ztile.offset1
-                                    l2 = ztile.layer2 + ztile.offset2
-                                    if l1 >= len(zon.textures):
-                                        l1 = l2
-                                    if l2 >= len(zon.textures):
-                                        l2 = l1
-                                    texture_pairs.add((l1, l2))
+                n_textures = len(zon.textures)
+                tile_pairs = [zon_tile_pair(t, n_textures) for t in zon.tiles]
+                patch_grids = [g.ravel() for g in tiles.patch_tiles if g is not None]
+                used_tiles = np.unique(np.concatenate(patch_grids)).tolist() if patch_grids else []
+                texture_pairs = {tile_pairs[t] for t in used_tiles if t < len(tile_pairs)}
 
                 # Create materials, one per texture pair
                 texture_materials, pair_to_slot = self.create_terrain_materials(
@@ -568,72 +732,65 @@ class ImportTerrain(bpy.types.Operator, ImportHelper):
                     for mat in texture_materials:
                         mesh.materials.append(mat)
                     
-                    # Build material index array for all faces
-                    material_indices = [0] * len(faces)
-                    face_idx = 0
-                    
-                    for ty in range(int(tiles.dimension.y)):
-                        for tx in range(int(tiles.dimension.x)):
-                            if not tiles.hims[ty][tx]:
+                    # Build material index array for all faces at once
+                    # (faces of out-of-range tiles keep slot 0). The face and
+                    # stitch ranges below are the ones recorded while the
+                    # faces were emitted, so they always lie inside it.
+                    if len(mesh.polygons) != n_faces:
+                        raise RuntimeError(f"Terrain mesh has {len(mesh.polygons)} faces, expected {n_faces}")
+                    material_indices = np.zeros(n_faces, dtype=np.int32)
+
+                    # ZON tile index -> material slot (-1 = unused pair; the
+                    # trailing entry catches out-of-range tile indices), so
+                    # a whole TIL grid maps to slots with one gather
+                    slot_lut = np.fromiter(
+                        (pair_to_slot.get(pair, -1) for pair in tile_pairs + [None]),
+                        dtype=np.int32, count=len(tile_pairs) + 1)
+                    tile_indices = tiles.indices
+
+                    for ty in range(dim_y):
+                        for tx in range(dim_x):
+                            i = ty * stride + tx
+                            him = tiles.hims[i]
+                            if not him or tiles.patch_tiles[i] is None:
                                 continue
-                            
-                            him = tiles.hims[ty][tx]
-                            til = tiles.tils[ty][tx]
-                            is_x_edge = (tx == tiles.dimension.x - 1)
-                            is_y_edge = (ty == tiles.dimension.y - 1)
 
                             # Must mirror the stitching loop: only count faces
                             # for neighbors that actually exist on disk
-                            has_x_neighbor = not is_x_edge and bool(tiles.indices[ty][tx + 1])
-                            has_y_neighbor = not is_y_edge and bool(tiles.indices[ty + 1][tx])
-                            has_xy_neighbor = has_x_neighbor and has_y_neighbor and bool(tiles.indices[ty + 1][tx + 1])
+                            has_x_neighbor = tx < dim_x - 1 and tile_indices[i + 1] is not None
+                            has_y_neighbor = ty < dim_y - 1 and tile_indices[i + stride] is not None
+                            has_xy_neighbor = has_x_neighbor and has_y_neighbor and tile_indices[i + stride + 1] is not None
 
-                            def slot_for(px, py):
-                                pair = texture_pair(til, zon, px, py, len(zon.textures))
-                                if pair is None:
-                                    return None
-                                return pair_to_slot.get(pair)
+                            # Material slot of every TIL patch
+                            patch_slots = slot_lut[tiles.patch_tiles[i]]
 
-                            # Main tile faces
                             # TIL is a 16x16 patch grid; each patch covers a 4x4
                             # quad area of the 64x64 heightmap grid.
-                            for vy in range(him.length - 1):
-                                for vx in range(him.width - 1):
-                                    if face_idx < len(faces) and til and til.tiles:
-                                        slot = slot_for(vx // 4, vy // 4)
-                                        if slot is not None:
-                                            material_indices[face_idx] = slot
-                                    face_idx += 1
-                            
-                            # Inter-tile X edge faces
+                            # Heightmap column/row -> clamped TIL patch index.
+                            h, w = him.length, him.width
+                            cx = np.minimum(np.arange(w) // 4, patch_slots.shape[1] - 1)
+                            cy = np.minimum(np.arange(h) // 4, patch_slots.shape[0] - 1)
+
+                            # Main faces (row-major), then stitches in emission
+                            # order: X edge, Y edge, corner
+                            groups = [(tiles.face_base[i], patch_slots[np.ix_(cy[:h - 1], cx[:w - 1])])]
+                            stitch = []
                             if has_x_neighbor:
-                                for vy in range(him.length - 1):
-                                    if face_idx < len(faces) and til and til.tiles:
-                                        slot = slot_for((him.width - 1) // 4, vy // 4)
-                                        if slot is not None:
-                                            material_indices[face_idx] = slot
-                                    face_idx += 1
-                            
-                            # Inter-tile Y edge faces
+                                stitch.append(patch_slots[cy[:h - 1], cx[w - 1]])
                             if has_y_neighbor:
-                                for vx in range(him.width - 1):
-                                    if face_idx < len(faces) and til and til.tiles:
-                                        slot = slot_for(vx // 4, (him.length - 1) // 4)
-                                        if slot is not None:
-                                            material_indices[face_idx] = slot
-                                    face_idx += 1
-                            
-                            # Corner faces
+                                stitch.append(patch_slots[cy[h - 1], cx[:w - 1]])
                             if has_xy_neighbor:
-                                if face_idx < len(faces) and til and til.tiles:
-                                    slot = slot_for((him.width - 1) // 4, (him.length - 1) // 4)
-                                    if slot is not None:
-                                        material_indices[face_idx] = slot
-                                face_idx += 1
-                    
-                    # Batch assign material indices to polygons
-                    for i, mat_idx in enumerate(material_indices):
-                        mesh.polygons[i].material_index = mat_idx
+                                stitch.append(patch_slots[cy[h - 1], cx[w - 1]].reshape(1))
+                            if stitch:
+                                groups.append((tiles.stitch_base[i], np.concatenate(stitch)))
+
+                            for face_start, slots in groups:
+                                slots = slots.ravel()
+                                face_slice = material_indices[face_start:face_start + len(slots)]
+                                np.copyto(face_slice, slots, where=slots >= 0)
+
+                    # Assign all material indices in one call
+                    mesh.polygons.foreach_set("material_index", material_indices)
 
             mesh.update(calc_edges=True)
 
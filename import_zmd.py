@@ -5,6 +5,7 @@ from bpy.props import StringProperty, BoolProperty
 from bpy_extras.io_utils import ImportHelper
 
 from .rose.zmd import ZMD
+from .rose.utils import bone_world_transforms, quat_rotate
 
 
 class ImportZMD(bpy.types.Operator, ImportHelper):
@@ -81,36 +82,22 @@ class ImportZMD(bpy.types.Operator, ImportHelper):
             bone = armature.edit_bones.new(rose_bone.name)
             bone.use_connect = False
 
-        # Build world transforms for each bone
-        world_positions = []
-        world_rotations = []
-        
-        for idx, rose_bone in enumerate(zmd.bones):
-            pos = bmath.Vector(rose_bone.position.as_tuple())
-            rot = bmath.Quaternion(rose_bone.rotation.as_tuple(w_first=True))
-            
-            if rose_bone.parent_id == -1:
-                # Root bone - use local transform as world transform
-                world_positions.append(pos)
-                world_rotations.append(rot)
-            else:
-                # Child bone - transform by parent's world transform
-                parent_pos = world_positions[rose_bone.parent_id]
-                parent_rot = world_rotations[rose_bone.parent_id]
-                
-                # Rotate position by parent rotation, then add parent position
-                world_pos = parent_pos + (parent_rot @ pos)
-                world_rot = parent_rot @ rot
-                
-                world_positions.append(world_pos)
-                world_rotations.append(world_rot)
+        # Build world transforms for each bone: children are rotated by
+        # the parent's world rotation and offset by its world position
+        # (computed for the whole skeleton at once, one level at a time)
+        world_positions, world_rotations = bone_world_transforms(
+            [b.parent_id for b in zmd.bones],
+            [b.position.as_tuple() for b in zmd.bones],
+            [b.rotation.as_tuple(w_first=True) for b in zmd.bones],
+        )
+        # Child bones point along their world rotation's Y axis
+        tail_offsets = quat_rotate(world_rotations, (0.0, 0.1, 0.0))
 
         # Now set bone positions and parenting
         for idx, rose_bone in enumerate(zmd.bones):
             bone = armature.edit_bones[idx]
             
-            world_pos = world_positions[idx]
-            world_rot = world_rotations[idx]
+            world_pos = bmath.Vector(world_positions[idx])
 
             if rose_bone.parent_id == -1:
                 # Root bone
@@ -130,7 +117,7 @@ class ImportZMD(bpy.types.Operator, ImportHelper):
                 bone.head = world_pos
                 
                 # Set tail to point in direction of rotation
-                bone.tail = world_pos + (world_rot @ bmath.Vector((0, 0.1, 0)))
+                bone.tail = world_pos + bmath.Vector(tail_offsets[idx])
                 
                 # Ensure minimum bone length
                 if bone.length < 0.001:
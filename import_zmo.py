@@ -5,14 +5,128 @@ ZMO files contain skeletal animation data that can be applied to armatures
 imported from ZMD files.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 import bpy
-import mathutils
-from mathutils import Quaternion, Vector, Matrix
+import numpy as np
 from bpy.props import StringProperty, IntProperty, FloatProperty
 from bpy_extras.io_utils import ImportHelper
 
-from .rose.zmo import ZMO, ZmoChannelType, ZmoPositionChannel, ZmoRotationChannel, ZmoScaleChannel
+from .rose.zmo import ZMO, ZmoChannelType
+
+# RNA value of Keyframe.interpolation 'LINEAR' (CONSTANT=0, LINEAR=1, BEZIER=2)
+KEYFRAME_INTERPOLATION_LINEAR = 1
+
+
+def _channel_array(channel, components):
+    """Values of a ZMO channel as an (N, len(components)) float32 array.
+
+    components names the attributes read from every value, in column
+    order (e.g. "xyz", or "wxyz" for rotations). Channels read from a
+    file already hold their frame data as an array in that order, which
+    is copied (callers modify the result in place) instead of walking
+    the value objects.
+    """
+    if channel.array is not None:
+        return channel.array.copy()
+    get = attrgetter(*components)
+    count = len(channel.values) * len(components)
+    flat = np.fromiter(chain.from_iterable(map(get, channel.values)),
+                       dtype=np.float32, count=count)
+    return flat.reshape(-1, len(components))
+
+
+def _new_fcurves(action, data_path, count):
+    """Create the fcurves for indices 0..count-1 of data_path.
+
+    The action is created fresh for every import and each bone has at
+    most one channel of a type, so no curve can exist yet and the linear
+    action.fcurves.find() scan is skipped.
+    """
+    return [action.fcurves.new(data_path, index=i) for i in range(count)]
+
+
+def _keyframe_co(frames, values):
+    """Interleaved float32 (frame, value) buffers for keyframe_points "co".
+
+    values is (N,) for one curve, giving a (2N,) buffer, or (N, k) for k
+    curves, giving one (k, 2N) allocation whose rows are the curves'
+    buffers.
+    """
+    values = np.asarray(values, dtype=np.float32)
+    co = np.empty(values.shape[1:] + (2 * len(frames),), dtype=np.float32)
+    co[..., 0::2] = frames
+    co[..., 1::2] = values.T
+    return co
+
+
+def _insert_keyframes(fcurve, co):
+    """Add the keyframes of a _keyframe_co() buffer to fcurve in one write.
+
+    keyframe_points.insert() re-sorts and resizes the curve on every call;
+    add() + foreach_set() fills the whole keyframe array at once, and the
+    handles are recalculated by a single fcurve.update().
+
+    ZMO keys are sampled once per frame and the game interpolates them
+    linearly, so the keys are LINEAR (set in bulk) instead of the default
+    auto-handle Bezier.
+    """
+    count = len(co) // 2
+    points = fcurve.keyframe_points
+    points.add(count)
+    points.foreach_set("co", co)
+    points.foreach_set("interpolation",
+                       np.full(count, KEYFRAME_INTERPOLATION_LINEAR, dtype=np.int32))
+    fcurve.update()
+
+
+def _position_keys(channel, frames, scale_factor):
+    """Keyframe buffers of a position channel (X, Y, Z curves).
+
+    NO coordinate transformation - use raw ROSE coordinates to match the skeleton.
+    Scale factor is applied (default 0.01 for cm to m).
+    """
+    # Use raw ROSE coordinates (no transform) to match skeleton
+    values = _channel_array(channel, "xyz")
+    values *= np.float32(scale_factor)
+    return _keyframe_co(frames, values)
+
+
+def _rotation_keys(channel, frames, scale_factor):
+    """Keyframe buffers of a rotation channel (W, X, Y, Z curves).
+
+    NO coordinate transformation - use raw ROSE coordinates to match the skeleton.
+    """
+    # Use raw ROSE quaternion (no transform) to match skeleton
+    # Blender's rotation_quaternion is (w, x, y, z)
+    values = _channel_array(channel, "wxyz")
+
+    # Normalize (zero-length quaternions are left as they are): one
+    # squared-length pass, then a divide of only the rows that need it
+    lengths_sq = np.einsum('ij,ij->i', values, values)
+    nonzero = lengths_sq > 0
+    values[nonzero] /= np.sqrt(lengths_sq[nonzero])[:, None]
+
+    return _keyframe_co(frames, values)
+
+
+def _scale_keys(channel, frames, scale_factor):
+    """Keyframe buffers of a scale channel (X, Y, Z curves)."""
+    # Uniform scale: the same keyframes on all three axes, so the
+    # buffer is built once and written to each curve
+    co = _keyframe_co(frames, channel.values)
+    return [co, co, co]
+
+
+# ZMO channel type -> (keyframe buffer builder, data path slot, curve count)
+_CHANNEL_KEYS = {
+    ZmoChannelType.POSITION: (_position_keys, 0, 3),
+    ZmoChannelType.ROTATION: (_rotation_keys, 1, 4),
+    ZmoChannelType.SCALE: (_scale_keys, 2, 3),
+}
 
 
 class ImportZMO(bpy.types.Operator, ImportHelper):
@@ -49,16 +163,11 @@ class ImportZMO(bpy.types.Operator, ImportHelper):
     )
     
     def execute(self, context):
-        filepath = Path(self.filepath)
-        filename = filepath.stem
-        
-        # Create a report function wrapper
-        def report_wrapper(level, message):
-            self.report({level}, message)
+        filename = Path(self.filepath).stem
         
         # Load ZMO file
         try:
-            zmo = ZMO(str(filepath), report_func=report_wrapper)
+            zmo = ZMO(self.filepath, report_func=self.report)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to load ZMO file: {str(e)}")
             return {'CANCELLED'}
@@ -123,132 +232,89 @@ class ImportZMO(bpy.types.Operator, ImportHelper):
         so they match. Our Blender plugin applies NO transform to either, so they also match.
         """
         bone_names = [bone.name for bone in armature_obj.data.bones]
-        bone_channels = zmo.get_bone_channels()
+        
+        # fcurve data paths of every bone, in _CHANNEL_KEYS slot order
+        bone_paths = {
+            name: (f'pose.bones["{name}"].location',
+                   f'pose.bones["{name}"].rotation_quaternion',
+                   f'pose.bones["{name}"].scale')
+            for name in bone_names
+        }
+        
+        # Keyframe numbers, shared by every channel (each holds one value
+        # per ZMO frame)
+        frames = np.arange(self.start_frame, self.start_frame + zmo.num_frames,
+                           dtype=np.float32)
         
         # Debug logging
         print(f"=== ZMO Animation Debug ===")
         print(f"Armature: {armature_obj.name}")
         print(f"Number of bones in armature: {len(bone_names)}")
-        print(f"Number of bone channels in ZMO: {len(bone_channels)}")
-        
-        # Ensure all pose bones use quaternion rotation mode
-        for pose_bone in armature_obj.pose.bones:
-            pose_bone.rotation_mode = 'QUATERNION'
+        print(f"Number of bone channels in ZMO: {len({bone_index for bone_index, _ in zmo.channels})}")
         
-        for bone_index, channels in bone_channels.items():
+        # Bone transform channels of bones the armature has, straight from
+        # the flat channel list; types that are not bone transforms
+        # (normals, UVs, ...) have no _CHANNEL_KEYS entry. Walked newest
+        # first so a repeated (bone, type) pair keeps the last channel,
+        # as zmo.get_bone_channels() does.
+        valid = []
+        seen = set()
+        skipped = set()
+        for bone_index, channel in reversed(zmo.channels):
             if bone_index >= len(bone_names):
-                print(f"WARNING: bone_index {bone_index} >= len(bone_names) {len(bone_names)}")
-                continue
-            
-            bone_name = bone_names[bone_index]
-            
-            # Debug: Log first frame data for each bone
-            pos_channel = channels.get(ZmoChannelType.POSITION)
-            rot_channel = channels.get(ZmoChannelType.ROTATION)
-            
-            if rot_channel and isinstance(rot_channel, ZmoRotationChannel):
-                first_rot = rot_channel.values[0] if rot_channel.values else None
-                if first_rot:
-                    print(f"Bone {bone_index} ({bone_name}): first rotation = ({first_rot.w:.4f}, {first_rot.x:.4f}, {first_rot.y:.4f}, {first_rot.z:.4f})")
-            
-            if pos_channel and isinstance(pos_channel, ZmoPositionChannel):
-                first_pos = pos_channel.values[0] if pos_channel.values else None
-                if first_pos:
-                    print(f"Bone {bone_index} ({bone_name}): first position = ({first_pos.x:.4f}, {first_pos.y:.4f}, {first_pos.z:.4f})")
-            
-            if pos_channel and isinstance(pos_channel, ZmoPositionChannel):
-                self._apply_position_channel(action, bone_name, pos_channel)
-            
-            if rot_channel and isinstance(rot_channel, ZmoRotationChannel):
-                self._apply_rotation_channel(action, bone_name, rot_channel)
-            
-            scale_channel = channels.get(ZmoChannelType.SCALE)
-            if scale_channel and isinstance(scale_channel, ZmoScaleChannel):
-                self._apply_scale_channel(action, bone_name, scale_channel)
+                skipped.add(bone_index)
+            elif (channel.channel_type in _CHANNEL_KEYS
+                    and (bone_index, channel.channel_type) not in seen):
+                seen.add((bone_index, channel.channel_type))
+                valid.append((bone_index, channel))
+        valid.reverse()
+        if skipped:
+            print(f"WARNING: bone indices {sorted(skipped)} >= len(bone_names) {len(bone_names)}")
+        if not valid:
+            print(f"=== End ZMO Animation Debug ===")
+            return
         
-        print(f"=== End ZMO Animation Debug ===")
-    
-    def _apply_position_channel(self, action, bone_name, channel):
-        """Apply position keyframes to a bone.
+        # Ensure the rotated pose bones use quaternion rotation mode (the
+        # other bones get no rotation_quaternion keys, so their mode does
+        # not matter)
+        pose_bones = armature_obj.pose.bones
+        for bone_index in {bone_index for bone_index, channel in valid
+                           if channel.channel_type == ZmoChannelType.ROTATION}:
+            pose_bones[bone_names[bone_index]].rotation_mode = 'QUATERNION'
         
-        NO coordinate transformation - use raw ROSE coordinates to match the skeleton.
-        Scale factor is applied (default 0.01 for cm to m).
-        """
-        data_path = f'pose.bones["{bone_name}"].location'
-        
-        fcurves = []
-        for i in range(3):
-            fcurve = action.fcurves.find(data_path, index=i)
-            if not fcurve:
-                fcurve = action.fcurves.new(data_path, index=i)
-            fcurves.append(fcurve)
-        
-        for frame_idx, pos in enumerate(channel.values):
-            frame = self.start_frame + frame_idx
+        # Phase 1 (main thread): create the fcurves of every channel
+        jobs = []
+        for bone_index, channel in valid:
+            bone_name = bone_names[bone_index]
+            channel_type = channel.channel_type
+            make_keys, slot, count = _CHANNEL_KEYS[channel_type]
             
-            # Use raw ROSE coordinates (no transform) to match skeleton
-            x = pos.x * self.scale_factor
-            y = pos.y * self.scale_factor
-            z = pos.z * self.scale_factor
+            # Debug: Log first frame data for each bone
+            if channel.values and channel_type == ZmoChannelType.ROTATION:
+                first_rot = channel.values[0]
+                print(f"Bone {bone_index} ({bone_name}): first rotation = ({first_rot.w:.4f}, {first_rot.x:.4f}, {first_rot.y:.4f}, {first_rot.z:.4f})")
+            elif channel.values and channel_type == ZmoChannelType.POSITION:
+                first_pos = channel.values[0]
+                print(f"Bone {bone_index} ({bone_name}): first position = ({first_pos.x:.4f}, {first_pos.y:.4f}, {first_pos.z:.4f})")
             
-            fcurves[0].keyframe_points.insert(frame, x)
-            fcurves[1].keyframe_points.insert(frame, y)
-            fcurves[2].keyframe_points.insert(frame, z)
-    
-    def _apply_rotation_channel(self, action, bone_name, channel):
-        """Apply rotation keyframes to a bone.
+            jobs.append((_new_fcurves(action, bone_paths[bone_name][slot], count), make_keys, channel))
         
-        NO coordinate transformation - use raw ROSE coordinates to match the skeleton.
-        """
-        data_path = f'pose.bones["{bone_name}"].rotation_quaternion'
+        # Phase 2: the keyframe buffers are pure NumPy work, built on a
+        # thread pool (the operator's properties are read here, not on the
+        # workers); each is written into its fcurves on the main thread as
+        # soon as it is ready, since bpy must stay off the workers
+        scale_factor = self.scale_factor
         
-        fcurves = []
-        for i in range(4):
-            fcurve = action.fcurves.find(data_path, index=i)
-            if not fcurve:
-                fcurve = action.fcurves.new(data_path, index=i)
-            fcurves.append(fcurve)
+        def build_keys(job):
+            _, make_keys, channel = job
+            return make_keys(channel, frames, scale_factor)
         
-        for frame_idx, quat in enumerate(channel.values):
-            frame = self.start_frame + frame_idx
-            
-            # Use raw ROSE quaternion (no transform) to match skeleton
-            # mathutils Quaternion expects (w, x, y, z)
-            w = quat.w
-            x = quat.x
-            y = quat.y
-            z = quat.z
-            
-            # Normalize
-            length = (w*w + x*x + y*y + z*z) ** 0.5
-            if length > 0:
-                w /= length
-                x /= length
-                y /= length
-                z /= length
-            
-            fcurves[0].keyframe_points.insert(frame, w)
-            fcurves[1].keyframe_points.insert(frame, x)
-            fcurves[2].keyframe_points.insert(frame, y)
-            fcurves[3].keyframe_points.insert(frame, z)
-    
-    def _apply_scale_channel(self, action, bone_name, channel):
-        """Apply scale keyframes to a bone."""
-        data_path = f'pose.bones["{bone_name}"].scale'
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4)) as pool:
+            for (fcurves, _, _), buffers in zip(jobs, pool.map(build_keys, jobs)):
+                for fcurve, co in zip(fcurves, buffers):
+                    _insert_keyframes(fcurve, co)
         
-        fcurves = []
-        for i in range(3):
-            fcurve = action.fcurves.find(data_path, index=i)
-            if not fcurve:
-                fcurve = action.fcurves.new(data_path, index=i)
-            fcurves.append(fcurve)
-        
-        for frame_idx, scale in enumerate(channel.values):
-            frame = self.start_frame + frame_idx
-            
-            fcurves[0].keyframe_points.insert(frame, scale)
-            fcurves[1].keyframe_points.insert(frame, scale)
-            fcurves[2].keyframe_points.insert(frame, scale)
+        print(f"=== End ZMO Animation Debug ===")
 
 
 def menu_func_import(self, context):
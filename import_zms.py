@@ -4,6 +4,7 @@ if "bpy" in locals():
     import importlib
 else:
     from .rose.zms import *
+    from .mesh_utils import mesh_from_arrays, loop_vertex_indices, set_vertex_uvs
 
 import bpy
 from bpy.props import StringProperty, BoolProperty
@@ -30,12 +31,8 @@ class ImportZMS(bpy.types.Operator, ImportHelper):
         filepath = Path(self.filepath)
         filename = filepath.stem
         
-        # Create a report function wrapper
-        def report_wrapper(level, message):
-            self.report({level}, message)
-        
         try:
-            zms = ZMS(str(filepath), report_func=report_wrapper)
+            zms = ZMS(str(filepath), report_func=self.report)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to load ZMS file: {str(e)}")
             return {'CANCELLED'}
@@ -68,7 +65,7 @@ class ImportZMS(bpy.types.Operator, ImportHelper):
                 # The group index corresponds to the index in the bones array
                 obj.vertex_groups.new(name=f"zms_bone_{i}")
 
-            # Assign weights per vertex. mesh.from_pydata created vertices in same order as zms.vertices
+            # Assign weights per vertex. The mesh vertices are in the same order as zms.vertices
             for vi, v in enumerate(zms.vertices):
                 # bone_weights is vec4 (4x float)
                 # bone_indices now contain the actual bone IDs (uint16 values after mapping)
@@ -111,69 +108,26 @@ class ImportZMS(bpy.types.Operator, ImportHelper):
         #-- Vertices (vec3 positions)
         # Mesh vertices are in local object space - use as-is from file
         # Coordinate transform is applied via object transform, not vertex positions
-        verts = []
-        for v in zms.vertices:
-            verts.append((v.position.x, v.position.y, v.position.z))
-
-        #-- Normals (in local space, use as-is)
-        normals = []
-        if zms.normals_enabled():
-            for v in zms.vertices:
-                normals.append((v.normal.x, v.normal.y, v.normal.z))
-        else:
-            # If no normals in file, let Blender compute them
-            normals = None
-
-        #-- Faces (usvec3 = 3x uint16 indices)
-        faces = []
-        for i in zms.indices:
-            faces.append((int(i.x), int(i.y), int(i.z)))
-
-        #-- Mesh
-        mesh.from_pydata(verts, [], faces)
+        # Positions, normals and faces (usvec3 = 3x uint16 indices) come
+        # straight from the arrays the ZMS parser read
+        mesh_from_arrays(mesh, zms.positions_array(), zms.indices_array())
         
-        #-- Set normals if available
+        #-- Set normals if available (in local space, use as-is); if the
+        # file has none, Blender computes them.
         # normals_split_custom_set expects one normal per loop (face-vertex), not per vertex
         # We need to map vertex normals to loop normals
-        if normals is not None:
-            loop_normals = []
-            for loop in mesh.loops:
-                vi = loop.vertex_index
-                loop_normals.append(normals[vi])
-            mesh.normals_split_custom_set(loop_normals)
-
-        #-- UV (vec2 coordinates, up to 4 channels)
-        if zms.uv1_enabled():
-            mesh.uv_layers.new(name="uv1")
-        if zms.uv2_enabled():
-            mesh.uv_layers.new(name="uv2")
-        if zms.uv3_enabled():
-            mesh.uv_layers.new(name="uv3")
-        if zms.uv4_enabled():
-            mesh.uv_layers.new(name="uv4")
-
-        for loop_idx, loop in enumerate(mesh.loops):
-            vi = loop.vertex_index
-
-            if zms.uv1_enabled():
-                u = zms.vertices[vi].uv1.x
-                v = zms.vertices[vi].uv1.y
-                mesh.uv_layers["uv1"].data[loop_idx].uv = (u, 1-v)  # Flip V
-            
-            if zms.uv2_enabled():
-                u = zms.vertices[vi].uv2.x
-                v = zms.vertices[vi].uv2.y
-                mesh.uv_layers["uv2"].data[loop_idx].uv = (u, 1-v)  # Flip V
-            
-            if zms.uv3_enabled():
-                u = zms.vertices[vi].uv3.x
-                v = zms.vertices[vi].uv3.y
-                mesh.uv_layers["uv3"].data[loop_idx].uv = (u, 1-v)  # Flip V
-            
-            if zms.uv4_enabled():
-                u = zms.vertices[vi].uv4.x
-                v = zms.vertices[vi].uv4.y
-                mesh.uv_layers["uv4"].data[loop_idx].uv = (u, 1-v)  # Flip V
+        loop_verts = loop_vertex_indices(mesh)
+        if zms.normals_enabled():
+            mesh.normals_split_custom_set(zms.normals_array()[loop_verts])
+
+        #-- UV (vec2 coordinates, up to 4 channels), V flipped; each layer
+        # is gathered through the shared loop vertex indices and written
+        # with one foreach_set
+        uv_enabled = (zms.uv1_enabled(), zms.uv2_enabled(), zms.uv3_enabled(), zms.uv4_enabled())
+        for channel, enabled in enumerate(uv_enabled, start=1):
+            if enabled:
+                set_vertex_uvs(mesh, zms.uv_array(channel), name=f"uv{channel}",
+                               loop_verts=loop_verts)
 
         #-- Material
         mat = bpy.data.materials.new(filename)
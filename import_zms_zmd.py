@@ -18,6 +18,7 @@ from bpy_extras.io_utils import ImportHelper
 
 from .rose.zms import ZMS
 from .rose.zmd import ZMD
+from .mesh_utils import mesh_from_arrays, loop_vertex_indices, set_vertex_uvs
 
 
 class ImportZMSwithZMD(bpy.types.Operator, ImportHelper):
@@ -120,11 +121,7 @@ class ImportZMSwithZMD(bpy.types.Operator, ImportHelper):
         imported_count = 0
         for zms_path in zms_files:
             try:
-                # Create a report function wrapper
-                def report_wrapper(level, message):
-                    self.report({level}, message)
-                
-                zms = ZMS(str(zms_path), report_func=report_wrapper)
+                zms = ZMS(str(zms_path), report_func=self.report)
                 mesh_obj = self._create_mesh(context, zms, zms_path.stem, armature_obj)
                 
                 # Parent mesh to armature
@@ -225,67 +222,22 @@ class ImportZMSwithZMD(bpy.types.Operator, ImportHelper):
         """Create mesh from ZMS data and optionally link to armature."""
         mesh = bpy.data.meshes.new(filename)
         
-        # Vertices
-        verts = []
-        for v in zms.vertices:
-            verts.append((v.position.x, v.position.y, v.position.z))
+        # Vertices and faces straight from the arrays the ZMS parser read
+        mesh_from_arrays(mesh, zms.positions_array(), zms.indices_array())
+        
+        # Loop vertex indices, shared by the normals and every UV layer
+        loop_verts = loop_vertex_indices(mesh)
         
-        # Normals
-        normals = []
+        # Set normals (one per loop, gathered through the loop vertex indices)
         if zms.normals_enabled():
-            for v in zms.vertices:
-                normals.append((v.normal.x, v.normal.y, v.normal.z))
-        else:
-            normals = None
-        
-        # Faces
-        faces = []
-        for i in zms.indices:
-            faces.append((int(i.x), int(i.y), int(i.z)))
-        
-        # Create mesh
-        mesh.from_pydata(verts, [], faces)
-        
-        # Set normals
-        if normals is not None:
-            loop_normals = []
-            for loop in mesh.loops:
-                vi = loop.vertex_index
-                loop_normals.append(normals[vi])
-            mesh.normals_split_custom_set(loop_normals)
-        
-        # UV layers
-        if zms.uv1_enabled():
-            mesh.uv_layers.new(name="uv1")
-        if zms.uv2_enabled():
-            mesh.uv_layers.new(name="uv2")
-        if zms.uv3_enabled():
-            mesh.uv_layers.new(name="uv3")
-        if zms.uv4_enabled():
-            mesh.uv_layers.new(name="uv4")
-        
-        for loop_idx, loop in enumerate(mesh.loops):
-            vi = loop.vertex_index
-            
-            if zms.uv1_enabled():
-                u = zms.vertices[vi].uv1.x
-                v = zms.vertices[vi].uv1.y
-                mesh.uv_layers["uv1"].data[loop_idx].uv = (u, 1 - v)
-            
-            if zms.uv2_enabled():
-                u = zms.vertices[vi].uv2.x
-                v = zms.vertices[vi].uv2.y
-                mesh.uv_layers["uv2"].data[loop_idx].uv = (u, 1 - v)
-            
-            if zms.uv3_enabled():
-                u = zms.vertices[vi].uv3.x
-                v = zms.vertices[vi].uv3.y
-                mesh.uv_layers["uv3"].data[loop_idx].uv = (u, 1 - v)
-            
-            if zms.uv4_enabled():
-                u = zms.vertices[vi].uv4.x
-                v = zms.vertices[vi].uv4.y
-                mesh.uv_layers["uv4"].data[loop_idx].uv = (u, 1 - v)
+            mesh.normals_split_custom_set(zms.normals_array()[loop_verts])
+        
+        # UV layers (V flipped), one foreach_set each
+        uv_enabled = (zms.uv1_enabled(), zms.uv2_enabled(), zms.uv3_enabled(), zms.uv4_enabled())
+        for channel, enabled in enumerate(uv_enabled, start=1):
+            if enabled:
+                set_vertex_uvs(mesh, zms.uv_array(channel), name=f"uv{channel}",
+                               loop_verts=loop_verts)
         
         # Material with texture
         mat = bpy.data.materials.new(filename)
@@ -8,6 +8,7 @@ else:
     from .rose.ifo import *
     from .rose.utils import convert_rose_position_to_blender
     from .import_zms import ImportZMS
+    from .mesh_utils import mesh_from_arrays, set_object_material, set_vertex_uvs
 
 import bpy
 from bpy.props import StringProperty, BoolProperty
@@ -200,10 +201,7 @@ class ImportZSC(bpy.types.Operator, ImportHelper):
         
         # Apply material
         if material_id in material_cache:
-            if len(obj.data.materials) > 0:
-                obj.data.materials[0] = material_cache[material_id]
-            else:
-                obj.data.materials.append(material_cache[material_id])
+            set_object_material(obj, material_cache[material_id])
         
         # Set transform (relative to parent)
         # Note: Parts use local coordinates relative to parent, so no world offset needed
@@ -251,21 +249,11 @@ class ImportZSC(bpy.types.Operator, ImportHelper):
             
             # Mesh vertices are in local object space - use as-is from file
             # Coordinate transform is applied via object transform, not vertex positions
-            verts = [(v.position.x, v.position.y, v.position.z) for v in zms.vertices]
-            
-            # Faces
-            faces = [(int(i.x), int(i.y), int(i.z)) for i in zms.indices]
-            
-            mesh.from_pydata(verts, [], faces)
+            mesh_from_arrays(mesh, zms.positions_array(), zms.indices_array())
             
             # UVs
             if zms.uv1_enabled():
-                mesh.uv_layers.new(name="UVMap")
-                for loop_idx, loop in enumerate(mesh.loops):
-                    vi = loop.vertex_index
-                    u = zms.vertices[vi].uv1.x
-                    v = zms.vertices[vi].uv1.y
-                    mesh.uv_layers["UVMap"].data[loop_idx].uv = (u, 1-v)
+                set_vertex_uvs(mesh, zms.uv_array(1))
             
             mesh.update(calc_edges=True)
             return mesh
@@ -300,7 +288,7 @@ class ImportZSC(bpy.types.Operator, ImportHelper):
             texture_path = self.resolve_texture(zsc_mat.path, base_path)
             if texture_path:
                 try:
-                    tex_node.image = bpy.data.images.load(str(texture_path))
+                    tex_node.image = bpy.data.images.load(str(texture_path), check_existing=True)
                 except:
                     self.report({'WARNING'}, f"Failed to load texture: {texture_path}")
             
@@ -0,0 +1,82 @@
+"""Bulk mesh construction shared by the importers.
+
+foreach_set() copies a whole NumPy buffer into a mesh attribute in one
+call, where from_pydata() and per-loop property writes convert every
+element through Python.
+"""
+import bpy
+import numpy as np
+
+
+def mesh_from_arrays(mesh, vertices, faces, update=True):
+    """Fill an empty mesh from vertex and face arrays.
+
+    Args:
+        mesh: freshly created bpy.types.Mesh
+        vertices: (N, 3) positions
+        faces: (F, K) vertex indices, K corners for every face
+        update: run mesh.update(calc_edges=True) to derive the edges;
+            pass False when the caller updates the mesh later itself
+    """
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
+    faces = np.ascontiguousarray(faces, dtype=np.int32)
+    if faces.ndim != 2:
+        faces = faces.reshape(-1, 3)
+    num_faces, corners = faces.shape
+
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set("co", vertices.ravel())
+    mesh.loops.add(num_faces * corners)
+    mesh.loops.foreach_set("vertex_index", faces.ravel())
+    mesh.polygons.add(num_faces)
+    mesh.polygons.foreach_set(
+        "loop_start", np.arange(0, num_faces * corners, corners, dtype=np.int32))
+    # Blender 4.0+ derives polygon sizes from loop_start (loop_total is read-only)
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set(
+            "loop_total", np.full(num_faces, corners, dtype=np.int32))
+
+    if update:
+        mesh.update(calc_edges=True)
+    return mesh
+
+
+def loop_vertex_indices(mesh):
+    """Vertex index of every loop as an int32 array (one foreach_get)."""
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    return loop_verts
+
+
+def set_vertex_uvs(mesh, vertex_uvs, name="UVMap", flip_v=True, loop_verts=None):
+    """Create a UV layer from per-vertex UVs ((N, 2) array).
+
+    The values are expanded to face corners through the loop vertex
+    indices (pass loop_verts from loop_vertex_indices() to reuse them
+    across layers). ROSE stores V top-down, so it is flipped by default.
+    """
+    if loop_verts is None:
+        loop_verts = loop_vertex_indices(mesh)
+
+    uvs = np.asarray(vertex_uvs, dtype=np.float32)[loop_verts]
+    if flip_v:
+        uvs[:, 1] = 1.0 - uvs[:, 1]
+
+    uv_layer = mesh.uv_layers.new(name=name)
+    uv_layer.data.foreach_set("uv", uvs.ravel())
+    return uv_layer
+
+
+def set_object_material(obj, material):
+    """Put material in obj's first slot, linked to the object.
+
+    Imported meshes are shared by every instance, so writing the material
+    into the mesh slot would change it for all of them; an object-linked
+    slot keeps the mesh untouched.
+    """
+    mesh = obj.data
+    if not mesh.materials:
+        mesh.materials.append(None)
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = material
@@ -0,0 +1,61 @@
+"""On-disk cache of parsed ROSE files.
+
+Re-importing a map re-parses every ZON/ZSC/HIM/TIL/IFO file in Python.
+cached_load() pickles the parsed object once and reloads it on later
+imports for as long as the source file's mtime and size are unchanged.
+"""
+import hashlib
+import os
+import pickle
+
+# Bump when a parser changes the attributes it produces, so pickles
+# written by an older version are not reused
+CACHE_VERSION = 2
+
+# Per-user location (not the shared temp dir: pickles are executable)
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "io_rose")
+
+
+def cache_path_for(cls, path, cache_dir=DEFAULT_CACHE_DIR):
+    """Cache file for `cls` parsed from `path`, keyed by its current stat"""
+    st = os.stat(path)
+    key = "|".join((
+        str(CACHE_VERSION),
+        f"{cls.__module__}.{cls.__qualname__}",
+        os.path.abspath(path),
+        str(st.st_mtime_ns),
+        str(st.st_size),
+    ))
+    return os.path.join(cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pickle")
+
+
+def cached_load(cls, path, cache_dir=DEFAULT_CACHE_DIR):
+    """Return cls(path), reusing a pickled parse when the file is unchanged.
+
+    Cache read/write failures are never fatal; the file is parsed
+    normally instead. Parse errors propagate as with cls(path).
+    """
+    path = str(path)
+    try:
+        cache_path = cache_path_for(cls, path, cache_dir)
+    except OSError:
+        return cls(path)
+
+    try:
+        with open(cache_path, "rb") as f:
+            obj = pickle.load(f)
+        if isinstance(obj, cls):
+            return obj
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError):
+        pass
+
+    obj = cls(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        pass
+    return obj
@@ -6,7 +6,8 @@ class Him:
         self.width = 0
         self.length = 0
         
-        # Two dimensional array for height data
+        # Two dimensional (length, width) float32 array of heights in cm,
+        # indexed heights[y][x]
         self.heights = [] 
         self.max_height = 0.0
         self.min_height = 0.0
@@ -29,16 +30,22 @@ class Him:
             self.grid_count = read_i32(f)
             self.patch_scale = read_f32(f)
             
-            self.heights = list_2d(self.width, self.length, 0)
-            for y in range(self.length):
-                for x in range(self.width):
-                    h = read_f32(f)
-                    self.heights[y][x] = h
-                    
-                    if h > self.max_height:
-                        self.max_height = h
-                    if h < self.min_height:
-                        self.min_height = h
+            # The whole height block in one read instead of one
+            # read_f32() call per sample
+            import numpy as np
+
+            count = self.width * self.length
+            data = f.read(count * 4)
+            if len(data) != count * 4:
+                raise ValueError(f"HIM height data truncated: {len(data)} of {count * 4} bytes")
+            self.heights = np.frombuffer(data, dtype='<f4').reshape(
+                self.length, self.width).astype(np.float32)
+
+            # The extremes start from 0.0 (a map entirely above or below
+            # sea level still reports 0.0 as its min or max)
+            if count:
+                self.max_height = max(0.0, float(self.heights.max()))
+                self.min_height = min(0.0, float(self.heights.min()))
 
             self._tail = f.read()
 
@@ -55,7 +62,7 @@ class Him:
             write_i32(f, self.length)
             write_i32(f, self.grid_count)
             write_f32(f, self.patch_scale)
-            for y in range(self.length):
-                for x in range(self.width):
-                    write_f32(f, self.heights[y][x])
+            import numpy as np
+            heights = np.asarray(self.heights, dtype='<f4')
+            f.write(heights.reshape(self.length, self.width).tobytes())
             f.write(self._tail)
@@ -81,6 +81,26 @@ class IfoNpc:
         self.quest_file_name = ""
         self.quest_file_name_raw = None
 
+def object_transform_arrays(objects):
+    """Gather IFO object transforms into NumPy arrays (SoA).
+
+    Returns:
+        (positions (N, 3), rotations (N, 4) in XYZW order, scales (N, 3)),
+        all float64, row i belonging to objects[i]
+    """
+    import numpy as np
+
+    n = len(objects)
+    flat = np.fromiter(
+        (value
+         for o in objects
+         for value in (o.position.x, o.position.y, o.position.z,
+                       o.rotation.x, o.rotation.y, o.rotation.z, o.rotation.w,
+                       o.scale.x, o.scale.y, o.scale.z)),
+        dtype=np.float64, count=n * 10,
+    ).reshape(n, 10)
+    return flat[:, 0:3], flat[:, 3:7], flat[:, 7:10]
+
 class Ifo:
     def __init__(self, filepath=None):
         self.monster_spawns = []
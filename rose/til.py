@@ -70,4 +70,9 @@ class Til:
                     write_i8(f, t.tile_set)
                     write_u32(f, t.tile)
 
+    def tile_indices_np(self):
+        """ZON tile index ('tile') of every patch as a (length, width)
+        int64 NumPy array, indexed [patch_y][patch_x] like self.tiles."""
+        import numpy as np
 
+        return np.array([[t.tile for t in row] for row in self.tiles], dtype=np.int64)
@@ -300,6 +300,34 @@ def list_2d(width, height, default=None):
     return [[default for _ in range(height)] for _ in range(width)]
 
 
+# Tiles per side of one traversal block in iter_tile_blocks(). 8x8 tiles
+# keeps a block's HIM/TIL objects (and their row lists) cache-resident.
+TILE_BLOCK = 8
+
+
+def iter_tile_blocks(dim_x, dim_y, block=TILE_BLOCK):
+    """Yield every (x, y) of a dim_x * dim_y tile grid in blocked order.
+
+    Each block x block group of tiles is visited completely before moving
+    on to the next one (loop tiling), instead of sweeping whole rows.
+
+    Args:
+        dim_x: Tile grid width
+        dim_y: Tile grid height
+        block: Tiles per side of one block
+
+    Yields:
+        (x, y) tile coordinates, each exactly once
+    """
+    for y0 in range(0, dim_y, block):
+        y1 = min(y0 + block, dim_y)
+        for x0 in range(0, dim_x, block):
+            x1 = min(x0 + block, dim_x)
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    yield x, y
+
+
 def convert_rose_position_to_blender(x, y, z):
     """
     Convert Rose Online coordinates to Blender coordinates.
@@ -324,6 +352,119 @@ def convert_rose_position_to_blender(x, y, z):
     return (x / 100.0, -y / 100.0, z / 100.0)
 
 
+def convert_rose_positions_to_blender(positions):
+    """Array form of convert_rose_position_to_blender.
+
+    Args:
+        positions: (N, 3) Rose positions
+
+    Returns:
+        New (N, 3) float64 NumPy array of Blender positions
+    """
+    import numpy as np
+
+    out = np.array(positions, dtype=np.float64).reshape(-1, 3) / 100.0
+    out[:, 1] = -out[:, 1]
+    return out
+
+
+def convert_rose_rotations_to_blender(rotations):
+    """Convert Rose XYZW quaternions to Blender WXYZ.
+
+    Both are Z-up; only the Y component is negated:
+    (x, y, z, w) -> (w, x, -y, z).
+
+    Args:
+        rotations: (N, 4) quaternions in XYZW order
+
+    Returns:
+        New (N, 4) float64 NumPy array in WXYZ order
+    """
+    import numpy as np
+
+    rotations = np.asarray(rotations, dtype=np.float64).reshape(-1, 4)
+    out = rotations[:, [3, 0, 1, 2]]
+    out[:, 2] = -out[:, 2]
+    return out
+
+
+def quat_multiply(a, b):
+    """Hamilton product a * b of WXYZ quaternions (broadcasting (..., 4) arrays)."""
+    import numpy as np
+
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ), axis=-1)
+
+
+def quat_rotate(q, v):
+    """Rotate vectors v ((..., 3)) by WXYZ quaternions q ((..., 4)).
+
+    Computes q * v * conj(q) like mathutils' Quaternion @ Vector (no
+    normalization, so a non-unit quaternion also scales by |q|^2).
+    """
+    import numpy as np
+
+    q = np.asarray(q, dtype=np.float64)
+    v = np.asarray(v, dtype=np.float64)
+    w = q[..., :1]
+    u = q[..., 1:]
+    return ((w * w - np.sum(u * u, axis=-1, keepdims=True)) * v
+            + 2.0 * np.sum(u * v, axis=-1, keepdims=True) * u
+            + 2.0 * w * np.cross(u, v))
+
+
+def bone_world_transforms(parent_ids, positions, rotations):
+    """World-space transforms of a bone hierarchy.
+
+    For every child: world_pos = parent_pos + parent_rot @ pos and
+    world_rot = parent_rot @ rot (roots keep their local transform).
+    Bones at the same depth are independent, so each hierarchy level is
+    transformed with one vectorized step.
+
+    Args:
+        parent_ids: parent index per bone, -1 for roots. Parents must
+            come before their children (as in ZMD files).
+        positions: (N, 3) local positions
+        rotations: (N, 4) local rotations, WXYZ
+
+    Returns:
+        (world_positions, world_rotations): (N, 3) and (N, 4) float64
+        NumPy arrays
+
+    Raises:
+        ValueError: if a parent index does not refer to an earlier bone
+    """
+    import numpy as np
+
+    parents = np.asarray(parent_ids, dtype=np.int64).reshape(-1)
+    world_positions = np.array(positions, dtype=np.float64).reshape(-1, 3)
+    world_rotations = np.array(rotations, dtype=np.float64).reshape(-1, 4)
+
+    depth = np.zeros(len(parents), dtype=np.int64)
+    for idx, parent in enumerate(parents.tolist()):
+        if parent == -1:
+            continue
+        if not 0 <= parent < idx:
+            raise ValueError(f"bone {idx} has invalid parent {parent}")
+        depth[idx] = depth[parent] + 1
+
+    for level in range(1, int(depth.max(initial=0)) + 1):
+        bones = np.flatnonzero(depth == level)
+        parent_pos = world_positions[parents[bones]]
+        parent_rot = world_rotations[parents[bones]]
+        world_positions[bones] = parent_pos + quat_rotate(parent_rot, world_positions[bones])
+        world_rotations[bones] = quat_multiply(parent_rot, world_rotations[bones])
+    return world_positions, world_rotations
+
+
 def apply_uv_rotation(u, v, rotation):
     """Rotate patch-local UV coordinates, matching the game shader
     apply_rotation() (terrain_material.wgsl).
@@ -349,6 +490,52 @@ def apply_uv_rotation(u, v, rotation):
     return (u, v)          # None / Unknown
 
 
+# ZON tile rotation -> (u offset, v offset, u sign, v sign, swap), so that
+# with (a, b) = (v, u) if swap else (u, v):
+#   u' = u_offset + u_sign * a,  v' = v_offset + v_sign * b
+# Values outside the table rotate like 0 (unchanged).
+UV_ROTATION_TABLE = (
+    (0.0, 0.0, 1.0, 1.0, False),    # 0: Unknown
+    (0.0, 0.0, 1.0, 1.0, False),    # 1: None
+    (1.0, 0.0, -1.0, 1.0, False),   # 2: FlipHorizontal
+    (0.0, 1.0, 1.0, -1.0, False),   # 3: FlipVertical
+    (1.0, 1.0, -1.0, -1.0, False),  # 4: Flip
+    (0.0, 1.0, 1.0, -1.0, True),    # 5: Clockwise90
+    (1.0, 0.0, -1.0, 1.0, True),    # 6: CounterClockwise90
+)
+
+# Corner offsets (v1, v2, v3, v4) of a terrain quad in patch UV space;
+# a quad spans a quarter of its 4x4-quad TIL patch
+QUAD_CORNER_U = (0.0, 0.25, 0.25, 0.0)
+QUAD_CORNER_V = (0.0, 0.0, 0.25, 0.25)
+
+
+def apply_uv_rotation_np(uvs, rotations):
+    """Array form of apply_uv_rotation, driven by UV_ROTATION_TABLE.
+
+    Args:
+        uvs: (..., 2) patch-local UV coordinates
+        rotations: ZON tile rotation values, broadcastable to uvs[..., 0]
+
+    Returns:
+        New float32 array of rotated UVs, shaped like uvs
+    """
+    import numpy as np
+
+    uvs = np.asarray(uvs, dtype=np.float32)
+    u, v = uvs[..., 0], uvs[..., 1]
+    rotations = np.asarray(rotations)
+    rotations = np.where((rotations >= 0) & (rotations < len(UV_ROTATION_TABLE)), rotations, 0)
+
+    table = np.array(UV_ROTATION_TABLE, dtype=np.float32)
+    u_off, v_off, u_sign, v_sign, swap = np.moveaxis(table[rotations], -1, 0)
+    swap = swap.astype(bool)
+    out = np.empty(np.broadcast(u, rotations).shape + (2,), dtype=np.float32)
+    out[..., 0] = u_off + u_sign * np.where(swap, v, u)
+    out[..., 1] = v_off + v_sign * np.where(swap, u, v)
+    return out
+
+
 def patch_rotation(til, zon, px, py):
     """Rotation of the TIL patch at (px, py); 1 (None) if unavailable."""
     if not til or not til.tiles:
@@ -385,7 +572,14 @@ def texture_pair(til, zon, px, py, texture_count):
     patch = til.tiles[til_y][til_x]
     if patch.tile >= len(zon.tiles):
         return None
-    tile = zon.tiles[patch.tile]
+    return zon_tile_pair(zon.tiles[patch.tile], texture_count)
+
+
+def zon_tile_pair(tile, texture_count):
+    """(layer1, layer2) texture indices of a ZON tile entry.
+
+    Invalid indices fall back to the other layer, see texture_pair().
+    """
     l1 = tile.layer1 + tile.offset1
     l2 = tile.layer2 + tile.offset2
     if l1 >= texture_count:
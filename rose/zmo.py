@@ -14,8 +14,7 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, BinaryIO, Union
 
 from .utils import (
-    read_str, read_u32, read_u16, read_f32,
-    read_vector2_f32, read_vector3_f32, read_quat_wxyz,
+    read_str, read_u32, read_u16,
     Vector2, Vector3, Quat
 )
 
@@ -37,9 +36,15 @@ class ZmoChannelType(IntFlag):
 
 @dataclass
 class ZmoChannel:
-    """Base class for ZMO animation channels."""
+    """Base class for ZMO animation channels.
+
+    Channels read from a file also carry `array`, the raw frame data as
+    a (num_frames, floats per frame) float32 array in file component
+    order (e.g. W, X, Y, Z for rotations); None for EMPTY channels.
+    """
     channel_type: ZmoChannelType
     bone_index: int
+    array: Optional["numpy.ndarray"] = field(default=None, repr=False)
 
 
 @dataclass
@@ -84,6 +89,18 @@ class ZmoScaleChannel(ZmoChannel):
     values: List[float] = field(default_factory=list)
 
 
+# Floats stored per frame for each channel class (EMPTY channels store none)
+CHANNEL_FRAME_FLOATS = {
+    ZmoPositionChannel: 3,
+    ZmoRotationChannel: 4,
+    ZmoNormalChannel: 3,
+    ZmoAlphaChannel: 1,
+    ZmoUVChannel: 2,
+    ZmoTextureChannel: 1,
+    ZmoScaleChannel: 1,
+}
+
+
 @dataclass
 class ZmoFile:
     """
@@ -155,7 +172,8 @@ class ZMO:
             filepath: Path to ZMO file
             buffer: Optional byte buffer to read from instead of file
             skip_animation: If True, skip reading animation frame data
-            report_func: Optional callback for reporting messages (level, message)
+            report_func: Optional callback for reporting messages, called as
+                report_func({level}, message) like Operator.report()
         """
         self.fps: int = 30
         self.num_frames: int = 0
@@ -177,7 +195,7 @@ class ZMO:
     def _report(self, level: str, message: str):
         """Report a message if callback is set."""
         if self._report_func:
-            self._report_func(level, message)
+            self._report_func({level}, message)
     
     def _read(self, f: BinaryIO, skip_animation: bool = False):
         """Read ZMO file from binary stream."""
@@ -206,9 +224,7 @@ class ZMO:
                 self.channels.append((bone_index, channel))
             
             # Second pass: read frame data for each channel
-            for frame_idx in range(self.num_frames):
-                for bone_index, channel in self.channels:
-                    self._read_channel_frame(f, channel)
+            self._read_frames(f)
         
         # Try to read extended data (frame events)
         self._read_extended_data(f)
@@ -237,24 +253,43 @@ class ZMO:
         else:
             raise ValueError(f"Invalid ZMO channel type: {channel_type}")
     
-    def _read_channel_frame(self, f: BinaryIO, channel: ZmoChannel):
-        """Read a single frame of data for a channel."""
-        if isinstance(channel, ZmoPositionChannel):
-            channel.values.append(read_vector3_f32(f))
-        elif isinstance(channel, ZmoRotationChannel):
+    def _read_frames(self, f: BinaryIO):
+        """Read the frame data of all channels.
+
+        Every frame stores one value per channel, all little-endian
+        float32, so the whole block is read as a single
+        (num_frames, floats per frame) array and sliced per channel
+        instead of unpacking each component separately.
+        """
+        import numpy as np
+
+        widths = [CHANNEL_FRAME_FLOATS.get(type(channel), 0) for _, channel in self.channels]
+        stride = sum(widths)
+        size = self.num_frames * stride * 4
+        data = f.read(size)
+        if len(data) != size:
+            raise ValueError(f"ZMO frame data truncated: {len(data)} of {size} bytes")
+        frames = np.frombuffer(data, dtype='<f4').reshape(self.num_frames, stride)
+
+        offset = 0
+        for (_, channel), width in zip(self.channels, widths):
+            if width:
+                # ZmoChannel (EMPTY) has no frame data
+                channel.array = frames[:, offset:offset + width].astype(np.float32)
+                channel.values = self._values_from_rows(channel, channel.array.tolist())
+            offset += width
+
+    @staticmethod
+    def _values_from_rows(channel: ZmoChannel, rows: list) -> list:
+        """Per-frame value objects of a channel from its rows of floats."""
+        if isinstance(channel, (ZmoPositionChannel, ZmoNormalChannel)):
+            return [Vector3(x, y, z) for x, y, z in rows]
+        if isinstance(channel, ZmoRotationChannel):
             # ZMO uses WXYZ order for quaternions
-            channel.values.append(read_quat_wxyz(f))
-        elif isinstance(channel, ZmoNormalChannel):
-            channel.values.append(read_vector3_f32(f))
-        elif isinstance(channel, ZmoAlphaChannel):
-            channel.values.append(read_f32(f))
-        elif isinstance(channel, ZmoUVChannel):
-            channel.values.append(read_vector2_f32(f))
-        elif isinstance(channel, ZmoTextureChannel):
-            channel.values.append(read_f32(f))
-        elif isinstance(channel, ZmoScaleChannel):
-            channel.values.append(read_f32(f))
-        # ZmoChannel (EMPTY) has no frame data
+            return [Quat(x, y, z, w) for w, x, y, z in rows]
+        if isinstance(channel, ZmoUVChannel):
+            return [Vector2(x, y) for x, y in rows]
+        return [row[0] for row in rows]
     
     def _read_extended_data(self, f: BinaryIO):
         """Read extended ZMO data (frame events)."""
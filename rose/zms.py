@@ -1,4 +1,5 @@
 from enum import IntEnum
+import struct
 from .utils import *
 
 class VertexFlags(IntEnum):
@@ -13,6 +14,9 @@ class VertexFlags(IntEnum):
     UV3 = 512         # (1 << 9)
     UV4 = 1024        # (1 << 10)
 
+# NumPy dtype string -> struct format code for the attribute blocks
+_STRUCT_CODES = {"<f4": "f", "<u4": "I", "<u2": "H"}
+
 class Vertex:
     def __init__(self):
         self.position = Vector3()
@@ -39,7 +43,14 @@ class ZMS:
         self.materials = []  # uint16 array (matid_numfaces)
         self.strips = []  # uint16 array (ibuf_strip)
         self.pool = 0  # pool setting
-        self.report_func = report_func  # Optional callback for reporting
+        # Optional callback for reporting, called as report_func({level},
+        # message) like Operator.report() (same contract as ZMO)
+        self.report_func = report_func
+        # Raw attribute blocks kept from read() so the *_array() accessors
+        # can view them with NumPy instead of re-walking self.vertices:
+        # name -> (bytes, value dtype, width, has vertex_id prefix, divisor)
+        self._blocks = {}
+        self._arrays = {}
 
         if filepath:
             with open(filepath, "rb") as f:
@@ -48,7 +59,7 @@ class ZMS:
     def report(self, level, message):
         """Helper method to report messages either via callback or print"""
         if self.report_func:
-            self.report_func(level, message)
+            self.report_func({level}, message)
         else:
             # Fallback to print if no report function provided
             print(f"[{level}] {message}")
@@ -82,6 +93,66 @@ class ZMS:
     def uv4_enabled(self):
         return (self.flags & VertexFlags.UV4) != 0
 
+    def positions_array(self):
+        """Vertex positions as an (N, 3) float32 array"""
+        return self._array("position", 3)
+
+    def normals_array(self):
+        """Vertex normals as an (N, 3) float32 array"""
+        return self._array("normal", 3)
+
+    def uv_array(self, channel=1):
+        """UV channel 1-4 as an (N, 2) float32 array (V not flipped)"""
+        return self._array(f"uv{channel}", 2)
+
+    def indices_array(self):
+        """Triangle indices as an (M, 3) uint32 array"""
+        return self._array("indices", 3)
+
+    def _array(self, name, width):
+        """View a raw attribute block as a NumPy array (cached).
+
+        Missing blocks come back zero-filled, matching the Vertex defaults.
+        """
+        arr = self._arrays.get(name)
+        if arr is not None:
+            return arr
+
+        import numpy as np
+
+        out_dtype = np.uint32 if name == "indices" else np.float32
+        block = self._blocks.get(name)
+        if block is None:
+            rows = len(self.indices) if name == "indices" else len(self.vertices)
+            arr = np.zeros((rows, width), dtype=out_dtype)
+        else:
+            data, value_type, width, has_id, divisor = block
+            if has_id:
+                record = np.dtype([("id", "<u4"), ("value", value_type, (width,))])
+                arr = np.frombuffer(data, dtype=record)["value"]
+            else:
+                arr = np.frombuffer(data, dtype=value_type).reshape(-1, width)
+            if divisor != 1.0:
+                arr = arr / divisor
+            arr = np.ascontiguousarray(arr, dtype=out_dtype)
+
+        self._arrays[name] = arr
+        return arr
+
+    def _read_block(self, f, name, count, value_type, width, has_id=False, divisor=1.0):
+        """Read `count` fixed-size records of one attribute in a single
+        f.read() and return them unpacked as tuples of `width` values."""
+        fmt = ("<I" if has_id else "<") + f"{width}{_STRUCT_CODES[value_type]}"
+        record_size = struct.calcsize(fmt)
+        data = f.read(count * record_size)
+        if len(data) != count * record_size:
+            raise struct.error(f"ZMS {name} block truncated")
+        self._blocks[name] = (data, value_type, width, has_id, divisor)
+        records = struct.iter_unpack(fmt, data)
+        if has_id:
+            return [r[1:] for r in records]
+        return list(records)
+
     def read(self, f):
         self.identifier = read_str(f)
         
@@ -101,6 +172,17 @@ class ZMS:
         else:
             raise ValueError(f"Unsupported ZMS version: {self.identifier}")
 
+    def _read_uvs(self, f, vert_count, has_id):
+        """Read the enabled UV channels (vec2 each) into the vertices"""
+        for channel, enabled in enumerate((self.uv1_enabled(), self.uv2_enabled(),
+                                           self.uv3_enabled(), self.uv4_enabled()), 1):
+            if not enabled:
+                continue
+            attr = f"uv{channel}"
+            uvs = self._read_block(f, attr, vert_count, "<f4", 2, has_id)
+            for v, (u, w) in zip(self.vertices, uvs):
+                setattr(v, attr, Vector2(u, w))
+
     def _read_version6(self, f, version):
         """Read ZMS version 5 or 6 format
         
@@ -130,17 +212,16 @@ class ZMS:
 
         # Read positions (scaled by 100.0 in version 5/6)
         if self.positions_enabled():
-            for i in range(vert_count):
-                _ = read_u32(f)  # vertex_id (uint32)
-                pos = read_vector3_f32(f)  # vec3
-                # Divide by 100.0 to unscale
-                self.vertices[i].position = Vector3(pos.x / 100.0, pos.y / 100.0, pos.z / 100.0)
+            # vertex_id (uint32) + vec3 per record; divide by 100.0 to unscale
+            positions = self._read_block(f, "position", vert_count, "<f4", 3, True, 100.0)
+            for v, (x, y, z) in zip(self.vertices, positions):
+                v.position = Vector3(x / 100.0, y / 100.0, z / 100.0)
 
         # Read normals
         if self.normals_enabled():
-            for i in range(vert_count):
-                _ = read_u32(f)  # vertex_id (uint32)
-                self.vertices[i].normal = read_vector3_f32(f)  # vec3
+            normals = self._read_block(f, "normal", vert_count, "<f4", 3, True)
+            for v, (x, y, z) in zip(self.vertices, normals):
+                v.normal = Vector3(x, y, z)  # vec3
 
         # Read colors
         if self.colors_enabled():
@@ -166,35 +247,13 @@ class ZMS:
                 _ = read_u32(f)  # vertex_id (uint32)
                 self.vertices[i].tangent = read_vector3_f32(f)  # vec3
 
-        # Read UV coordinates
-        if self.uv1_enabled():
-            for i in range(vert_count):
-                _ = read_u32(f)  # vertex_id (uint32)
-                self.vertices[i].uv1 = read_vector2_f32(f)  # vec2
-
-        if self.uv2_enabled():
-            for i in range(vert_count):
-                _ = read_u32(f)  # vertex_id (uint32)
-                self.vertices[i].uv2 = read_vector2_f32(f)  # vec2
-
-        if self.uv3_enabled():
-            for i in range(vert_count):
-                _ = read_u32(f)  # vertex_id (uint32)
-                self.vertices[i].uv3 = read_vector2_f32(f)  # vec2
-
-        if self.uv4_enabled():
-            for i in range(vert_count):
-                _ = read_u32(f)  # vertex_id (uint32)
-                self.vertices[i].uv4 = read_vector2_f32(f)  # vec2
+        # Read UV coordinates (vertex_id (uint32) + vec2 per record)
+        self._read_uvs(f, vert_count, True)
 
         # Read triangle indices (usvec3 = 3x uint16, but stored as uint32 in v5/6 file format)
         triangle_count = read_u32(f)  # uint32 in v5/6
-        for i in range(triangle_count):
-            _ = read_u32(f)  # triangle_id (uint32)
-            idx1 = read_u32(f)  # uint32 in file
-            idx2 = read_u32(f)  # uint32 in file
-            idx3 = read_u32(f)  # uint32 in file
-            self.indices.append(Vector3(idx1, idx2, idx3))
+        triangles = self._read_block(f, "indices", triangle_count, "<u4", 3, True)
+        self.indices = [Vector3(a, b, c) for a, b, c in triangles]
 
         # Read materials (version 6 only) - uint16 * num_matids
         if version >= 6:
@@ -231,12 +290,14 @@ class ZMS:
 
         # Read vertex data (no vertex_id prefix in version 7/8)
         if self.positions_enabled():
-            for i in range(vert_count):
-                self.vertices[i].position = read_vector3_f32(f)  # vec3
+            positions = self._read_block(f, "position", vert_count, "<f4", 3)
+            for v, (x, y, z) in zip(self.vertices, positions):
+                v.position = Vector3(x, y, z)  # vec3
 
         if self.normals_enabled():
-            for i in range(vert_count):
-                self.vertices[i].normal = read_vector3_f32(f)  # vec3
+            normals = self._read_block(f, "normal", vert_count, "<f4", 3)
+            for v, (x, y, z) in zip(self.vertices, normals):
+                v.normal = Vector3(x, y, z)  # vec3
 
         if self.colors_enabled():
             for i in range(vert_count):
@@ -256,27 +317,12 @@ class ZMS:
             for i in range(vert_count):
                 self.vertices[i].tangent = read_vector3_f32(f)  # vec3
 
-        if self.uv1_enabled():
-            for i in range(vert_count):
-                self.vertices[i].uv1 = read_vector2_f32(f)  # vec2
-
-        if self.uv2_enabled():
-            for i in range(vert_count):
-                self.vertices[i].uv2 = read_vector2_f32(f)  # vec2
-
-        if self.uv3_enabled():
-            for i in range(vert_count):
-                self.vertices[i].uv3 = read_vector2_f32(f)  # vec2
-
-        if self.uv4_enabled():
-            for i in range(vert_count):
-                self.vertices[i].uv4 = read_vector2_f32(f)  # vec2
+        self._read_uvs(f, vert_count, False)
 
         # Read indices - flat array (usvec3 = 3x uint16)
         index_count = read_u16(f)  # uint16 num_faces (matches C++)
-        indices_flat = read_list_u16(f, index_count * 3)  # uint16 indices
-        for i in range(0, len(indices_flat), 3):
-            self.indices.append(Vector3(indices_flat[i], indices_flat[i+1], indices_flat[i+2]))
+        triangles = self._read_block(f, "indices", index_count, "<u2", 3)
+        self.indices = [Vector3(a, b, c) for a, b, c in triangles]
 
         # Read materials (uint16 * num_matids)
         material_count = read_u16(f)  # uint16 num_matids
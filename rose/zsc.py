@@ -146,11 +146,28 @@ class Zsc:
         self.objects: List[ZscObject] = []
         self.raw: bytes = None          # original file bytes (for lossless save)
         self._section_offsets = None    # (meshes, materials, effects, objects) byte ranges
+        self._mat_ids_per_obj = None    # lazily built by used_material_ids()
         self.load(filepath)
 
     def __repr__(self):
         return f"Zsc(file='{self.filepath}', meshes={len(self.meshes)}, materials={len(self.materials)}, objects={len(self.objects)})"
 
+    def used_material_ids(self, object_ids):
+        """Sorted unique material ids referenced by the parts of the given
+        objects (out-of-range object ids are ignored)."""
+        import numpy as np
+
+        if self._mat_ids_per_obj is None:
+            self._mat_ids_per_obj = [
+                np.fromiter((p.material_id for p in obj.parts), dtype=np.int32, count=len(obj.parts))
+                for obj in self.objects
+            ]
+        ids = np.fromiter(object_ids, dtype=np.int64)
+        ids = ids[(ids >= 0) & (ids < len(self.objects))]
+        if not ids.size:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate([self._mat_ids_per_obj[i] for i in ids]))
+
     def load(self, filepath: str):
         """Load and parse the ZSC file with logging."""
         zsc_size = os.path.getsize(filepath)
@@ -1,7 +1,11 @@
 """Unit tests for the pure terrain helpers in rose/utils.py.
 
 - apply_uv_rotation: all six ZON rotations (shader match).
+- apply_uv_rotation_np: array form agrees with apply_uv_rotation.
 - patch_rotation / texture_pair: TIL patch lookups.
+- iter_tile_blocks: blocked tile-grid traversal covers every tile once.
+- bone_world_transforms: level-wise skeleton transforms agree with a
+  bone-by-bone quaternion reference.
 
 Exit code 0 on success, 1 on failure.
 """
@@ -52,6 +56,83 @@ def test_uv_rotation():
     print("apply_uv_rotation: all cases pass")
 
 
+def test_uv_rotation_np():
+    import numpy as np
+    from rose.utils import apply_uv_rotation_np
+
+    grid = np.linspace(0.0, 1.0, 5)
+    uvs = np.stack(np.meshgrid(grid, grid), axis=-1).reshape(-1, 2)
+    for rot in (0, 1, 2, 3, 4, 5, 6, 99):
+        got = apply_uv_rotation_np(uvs, rot)
+        expected = np.array([apply_uv_rotation(u, v, rot) for u, v in uvs])
+        assert np.allclose(got, expected), f"rotation {rot}: array form differs"
+    # Per-UV rotations broadcast against the UV array
+    rots = np.arange(len(uvs)) % 7
+    got = apply_uv_rotation_np(uvs, rots)
+    expected = np.array([apply_uv_rotation(u, v, r) for (u, v), r in zip(uvs, rots)])
+    assert np.allclose(got, expected), "mixed rotations: array form differs"
+    print("apply_uv_rotation_np: matches apply_uv_rotation")
+
+
+def test_tile_blocks():
+    from rose.utils import iter_tile_blocks
+
+    for dim_x, dim_y, block in [(1, 1, 8), (4, 4, 8), (17, 9, 8), (64, 64, 8), (5, 7, 2)]:
+        coords = list(iter_tile_blocks(dim_x, dim_y, block))
+        expected = {(x, y) for y in range(dim_y) for x in range(dim_x)}
+        assert len(coords) == len(expected), f"{dim_x}x{dim_y}: duplicates"
+        assert set(coords) == expected, f"{dim_x}x{dim_y}: missing tiles"
+    # First block is finished before the second one starts
+    coords = list(iter_tile_blocks(4, 2, 2))
+    assert coords[:4] == [(0, 0), (1, 0), (0, 1), (1, 1)], coords
+    print("iter_tile_blocks: all grids covered exactly once")
+
+
+def test_bone_world_transforms():
+    import numpy as np
+    from rose.utils import bone_world_transforms
+
+    def qmul(a, b):
+        aw, ax, ay, az = a
+        bw, bx, by, bz = b
+        return (aw * bw - ax * bx - ay * by - az * bz,
+                aw * bx + ax * bw + ay * bz - az * by,
+                aw * by - ax * bz + ay * bw + az * bx,
+                aw * bz + ax * by - ay * bx + az * bw)
+
+    def qrot(q, v):
+        return qmul(qmul(q, (0.0, *v)), (q[0], -q[1], -q[2], -q[3]))[1:]
+
+    rng = np.random.default_rng(7)
+    n = 50
+    parents = [-1] + [int(rng.integers(-1, i)) for i in range(1, n)]
+    positions = rng.normal(size=(n, 3))
+    rotations = rng.normal(size=(n, 4))
+
+    # Bone-by-bone reference (the old per-bone mathutils loop)
+    ref_pos, ref_rot = [], []
+    for idx, parent in enumerate(parents):
+        if parent == -1:
+            ref_pos.append(tuple(positions[idx]))
+            ref_rot.append(tuple(rotations[idx]))
+        else:
+            offset = qrot(ref_rot[parent], positions[idx])
+            ref_pos.append(tuple(p + o for p, o in zip(ref_pos[parent], offset)))
+            ref_rot.append(qmul(ref_rot[parent], rotations[idx]))
+
+    world_pos, world_rot = bone_world_transforms(parents, positions, rotations)
+    assert np.allclose(world_pos, ref_pos), "world positions differ"
+    assert np.allclose(world_rot, ref_rot), "world rotations differ"
+
+    try:
+        bone_world_transforms([-1, 2, 0], positions[:3], rotations[:3])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("forward parent reference accepted")
+    print(f"bone_world_transforms: {n} bones match the per-bone reference")
+
+
 def test_patch_helpers():
     from rose.zon import Zon
     from rose.til import Til
@@ -89,6 +170,9 @@ def test_patch_helpers():
 
 def main():
     test_uv_rotation()
+    test_uv_rotation_np()
+    test_tile_blocks()
+    test_bone_world_transforms()
     test_patch_helpers()
     print("ALL HELPER TESTS PASSED")
     return 0
@@ -0,0 +1,92 @@
+"""Tests for the on-disk parse cache (rose/cache.py).
+
+For every ZON/HIM/TIL/IFO file in the zone directory:
+- the first cached_load() writes a pickle, the second one reads it back
+- the object coming out of the cache still saves BYTE-IDENTICAL to the
+  source file (so cached imports feed the exporter the same data)
+- touching the source file changes the cache key (stale pickles unused)
+
+Exit code 0 on success, 1 on failure.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ADDON_ROOT)
+
+import _paths
+
+from rose.cache import cached_load, cache_path_for
+from rose.zon import Zon
+from rose.him import Him
+from rose.til import Til
+from rose.ifo import Ifo
+
+ZONE_DIR = os.environ.get(
+    "ROSE_TEST_ZONE",
+    _paths.client_zone_dir(),
+)
+
+PARSERS = {"ZON": Zon, "HIM": Him, "TIL": Til, "IFO": Ifo}
+
+
+def check_file(parser_cls, path, cache_dir, work_dir):
+    # Work on a copy so the mtime can be bumped safely
+    src = os.path.join(work_dir, os.path.basename(path))
+    shutil.copyfile(path, src)
+
+    cache_file = cache_path_for(parser_cls, src, cache_dir)
+    cached_load(parser_cls, src, cache_dir)
+    assert os.path.exists(cache_file), "first load did not write the cache"
+
+    obj = cached_load(parser_cls, src, cache_dir)
+    out = os.path.join(work_dir, "out_" + os.path.basename(path))
+    obj.save(out)
+    with open(src, "rb") as a, open(out, "rb") as b:
+        assert a.read() == b.read(), "cached object does not round-trip"
+
+    st = os.stat(src)
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert cache_path_for(parser_cls, src, cache_dir) != cache_file, \
+        "cache key ignores mtime"
+
+
+def main():
+    if not os.path.isdir(ZONE_DIR):
+        print(f"zone dir not found: {ZONE_DIR}")
+        print("set ROSE_TEST_ZONE to a zone directory")
+        return 1
+
+    cache_dir = tempfile.mkdtemp()
+    work_dir = tempfile.mkdtemp()
+    fail = 0
+    checked = 0
+
+    for name in sorted(os.listdir(ZONE_DIR)):
+        parser = PARSERS.get(name[-3:].upper())
+        if parser is None:
+            continue
+        try:
+            check_file(parser, os.path.join(ZONE_DIR, name), cache_dir, work_dir)
+            checked += 1
+        except Exception as e:
+            print(f"  {name}: FAIL: {e}")
+            fail += 1
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+    if checked == 0 and not fail:
+        print("no zone files found")
+        return 1
+    if fail:
+        print(f"\n{checked} files ok, {fail} FAILURES")
+        return 1
+    print(f"\nall ok: {checked} files load from the parse cache unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""Tests for the ZMO animation parser (rose/zmo.py).
+
+Builds a synthetic ZMO in memory (no client data needed) with one
+channel of every kind plus EMPTY channels and 3ZMO extended data, then
+checks that:
+- every channel's values match the floats that were written
+- rotations keep the file's W, X, Y, Z order
+- channel.array holds the same frame data as float32 rows
+- frame events and the interpolation interval are read after the frames
+- truncated frame data raises ValueError
+
+Exit code 0 on success, 1 on failure.
+"""
+import os
+import random
+import struct
+import sys
+
+ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ADDON_ROOT)
+
+from rose.zmo import ZMO, ZmoChannelType, CHANNEL_FRAME_FLOATS
+
+CHANNELS = [
+    (ZmoChannelType.POSITION, 0),
+    (ZmoChannelType.ROTATION, 0),
+    (ZmoChannelType.EMPTY, 3),
+    (ZmoChannelType.SCALE, 1),
+    (ZmoChannelType.NORMAL, 2),
+    (ZmoChannelType.ALPHA, 2),
+    (ZmoChannelType.UV2, 4),
+    (ZmoChannelType.TEXTURE, 5),
+    (ZmoChannelType.EMPTY, 6),
+]
+NUM_FRAMES = 7
+FRAME_EVENTS = [21, 5, 10]
+INTERVAL_MS = 33
+
+
+def float32(value):
+    return struct.unpack("<f", struct.pack("<f", value))[0]
+
+
+def build_zmo(rng):
+    """Synthetic 3ZMO file and the per-channel frame floats written to it"""
+    data = b"ZMO0002\0" + struct.pack("<III", 30, NUM_FRAMES, len(CHANNELS))
+    for channel_type, bone_index in CHANNELS:
+        data += struct.pack("<II", channel_type, bone_index)
+
+    widths = [0 if t == ZmoChannelType.EMPTY else
+              {ZmoChannelType.POSITION: 3, ZmoChannelType.ROTATION: 4,
+               ZmoChannelType.NORMAL: 3, ZmoChannelType.UV2: 2}.get(t, 1)
+              for t, _ in CHANNELS]
+    written = [[] for _ in CHANNELS]
+    for _ in range(NUM_FRAMES):
+        for i, width in enumerate(widths):
+            row = [float32(rng.uniform(-100.0, 100.0)) for _ in range(width)]
+            written[i].append(row)
+            data += struct.pack(f"<{width}f", *row)
+
+    extended = len(data)
+    data += struct.pack("<H", len(FRAME_EVENTS))
+    data += struct.pack(f"<{len(FRAME_EVENTS)}H", *FRAME_EVENTS)
+    data += struct.pack("<II", INTERVAL_MS, extended) + b"3ZMO"
+    return data, written
+
+
+def value_floats(channel_type, value):
+    if channel_type in (ZmoChannelType.POSITION, ZmoChannelType.NORMAL):
+        return [value.x, value.y, value.z]
+    if channel_type == ZmoChannelType.ROTATION:
+        return [value.w, value.x, value.y, value.z]
+    if channel_type == ZmoChannelType.UV2:
+        return [value.x, value.y]
+    return [value]
+
+
+def test_parse():
+    data, written = build_zmo(random.Random(7))
+    zmo = ZMO(buffer=data)
+
+    assert zmo.num_frames == NUM_FRAMES and zmo.fps == 30
+    assert len(zmo.channels) == len(CHANNELS)
+    for (bone_index, channel), (channel_type, expected_bone), rows in zip(
+            zmo.channels, CHANNELS, written):
+        assert bone_index == expected_bone and channel.channel_type == channel_type
+        if channel_type == ZmoChannelType.EMPTY:
+            assert channel.array is None
+            continue
+        width = CHANNEL_FRAME_FLOATS[type(channel)]
+        values = [value_floats(channel_type, v) for v in channel.values]
+        assert values == rows, f"{channel_type.name}: values differ"
+        assert channel.array.shape == (NUM_FRAMES, width)
+        assert channel.array.tolist() == rows, f"{channel_type.name}: array differs"
+
+    assert zmo.frame_events == FRAME_EVENTS
+    assert zmo.total_attack_frames == 2
+    assert zmo.interpolation_interval_ms == INTERVAL_MS
+    print(f"parse: {len(CHANNELS)} channels x {NUM_FRAMES} frames ok")
+
+
+def test_truncated():
+    data, _ = build_zmo(random.Random(7))
+    header = 8 + 12 + 8 * len(CHANNELS)
+    try:
+        ZMO(buffer=data[:header + 10])
+    except ValueError:
+        print("truncated frame data: ValueError ok")
+        return
+    raise AssertionError("truncated frame data was accepted")
+
+
+def main():
+    try:
+        test_parse()
+        test_truncated()
+    except AssertionError as e:
+        print(f"FAIL: {e}")
+        return 1
+    print("ALL ZMO TESTS PASSED")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())